@@ -9,9 +9,17 @@ Heuristic extractors (TypeScript, Business Rule, Failure Mode, etc.) are depreca
 For semantic analysis, use Copilot Chat with extracted code context and AKR charters.
 """
 
+import copy
+import hashlib
+import json
 import logging
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 from .extractors.csharp_extractor import CSharpExtractor
 from .extractors.sql_extractor import SQLExtractor
@@ -20,34 +28,78 @@ from .extractors.base_extractor import ExtractedData
 
 logger = logging.getLogger(__name__)
 
+EXTRACTOR_VERSION = "0.2.0"
+
+
+# Most analyze() results a CodeAnalyzer keeps in memory; least recently used go first
+_ANALYSIS_CACHE_MAXSIZE = 2048
+
+
+@lru_cache(maxsize=None)
+def _disk_cache_version() -> str:
+    """Version component of cache_dir entries, computed on first disk-cache use.
+    
+    EXTRACTOR_VERSION is only bumped on releases, so persisted analyses are
+    also keyed on a short SHA-256 of this module and the extractor sources and
+    expire whenever that code changes.
+    """
+    digest = hashlib.sha256()
+    module_dir = Path(__file__).parent
+    try:
+        for source in [Path(__file__), *sorted((module_dir / "extractors").glob("*.py"))]:
+            digest.update(source.read_bytes())
+    except OSError as e:
+        logger.warning(f"Could not hash extractor sources, caching by release version only: {e}")
+        return f"{EXTRACTOR_VERSION}+unhashed"
+    return f"{EXTRACTOR_VERSION}+{digest.hexdigest()[:16]}"
+
+# Supported source extensions, matched case-insensitively as the file name's suffix.
+# As with Path.suffix, the dot must follow a file-name character, so a bare
+# dotfile such as ".cs" has no extension.
+_LANGUAGE_EXTENSION_RE = re.compile(r'[^/\\]\.(cs|sql)\Z', re.IGNORECASE)
+_LANGUAGE_BY_EXTENSION = {
+    'cs': 'csharp',
+    'sql': 'sql',
+}
+
+
+@lru_cache(maxsize=2048)
+def _detect_language(file_path: str) -> Optional[str]:
+    """Map a path to its language; the extension mapping is fixed, so results never go stale."""
+    match = _LANGUAGE_EXTENSION_RE.search(file_path)
+    if not match:
+        return None
+    return _LANGUAGE_BY_EXTENSION[match.group(1).lower()]
+
 
 class CodeAnalyzer:
     """Unified code analyzer using deterministic extractors."""
     
-    def __init__(self):
-        """Initialize code analyzer with deterministic extractors."""
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Initialize code analyzer with deterministic extractors.
+        
+        Args:
+            cache_dir: Optional directory for persisting analyze() results across
+                       processes. Results are always memoized in memory.
+        """
         self.csharp_extractor = CSharpExtractor()
         self.sql_extractor = SQLExtractor()
         self.extractors = [self.csharp_extractor, self.sql_extractor]
+        
+        # LRU of analyze() results keyed by (content SHA-256, language, extractor version, extraction types)
+        self._analysis_cache: OrderedDict[Tuple[str, str, str, Tuple[str, ...]], Dict[str, Any]] = OrderedDict()
+        self._cache_dir = Path(cache_dir) if cache_dir else None
     
-    def detect_language(self, file_path: str) -> Optional[str]:
+    def detect_language(self, file_path: Union[str, os.PathLike]) -> Optional[str]:
         """Detect primary language from file extension.
         
         Args:
-            file_path: Path to source file
+            file_path: Path to source file (str or Path)
             
         Returns:
             Language identifier ('csharp', 'sql', or None if unknown)
         """
-        path = Path(file_path)
-        suffix = path.suffix.lower()
-        
-        language_map = {
-            '.cs': 'csharp',
-            '.sql': 'sql',
-        }
-        
-        return language_map.get(suffix)
+        return _detect_language(os.fspath(file_path))
     
     def extract_methods(self, file_path: str) -> List[Dict[str, Any]]:
         """Extract methods/functions from source file.
@@ -183,37 +235,187 @@ class CodeAnalyzer:
             - sql_tables: Extracted SQL tables (if applicable)
             - metadata: Extraction metadata (timestamp, extractor version, etc.)
             - extraction_errors: List of errors encountered
+        
+        Results are cached by file content, so re-analyzing identical source
+        (at the same or another path) skips the extractors.
         """
-        path = Path(file_path)
-        language = self.detect_language(file_path)
+        return self.analyze_many([file_path], extraction_types)[0]
+    
+    def analyze_many(
+        self,
+        file_paths: List[str],
+        extraction_types: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Analyze several source files, batching extraction per language.
         
-        extraction_errors = []
+        Uncached files are grouped by detected language and each group is
+        handed to its extractor's extract_batch(). Each file is read once and
+        the same bytes are hashed for the cache and parsed, so an edit between
+        the two can't be cached under the wrong content. Identical content is
+        parsed only once.
+        
+        Args:
+            file_paths: Paths to source files
+            extraction_types: Extraction types to perform for every file
+                            (None auto-selects per language, as in analyze())
+        
+        Returns:
+            One analyze() result dict per input path, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(file_paths)
+        # Uncached sources per language: cache key -> (source, types, input indices)
+        pending: Dict[str, Dict[Tuple, Tuple[str, List[str], List[int]]]] = {}
+        
+        for index, file_path in enumerate(file_paths):
+            language = self.detect_language(file_path)
+            if not language:
+                results[index] = self._unsupported_result(file_path)
+                continue
+            
+            types = self._resolve_extraction_types(language, extraction_types)
+            
+            try:
+                data = Path(file_path).read_bytes()
+            except OSError as e:
+                # Unreadable file: nothing to extract or cache
+                logger.error(f"Error reading {file_path}: {e}")
+                results[index] = self._build_result(file_path, language, types, None)
+                continue
+            
+            cache_key = (hashlib.sha256(data).hexdigest(), language, EXTRACTOR_VERSION, tuple(sorted(types)))
+            cached = self._get_cached_analysis(cache_key)
+            if cached is not None:
+                results[index] = self._result_for_path(cached, file_path)
+                continue
+            
+            batch = pending.setdefault(language, {})
+            if cache_key in batch:
+                batch[cache_key][2].append(index)
+                continue
+            
+            content = self._decode_source(data, file_path)
+            if content is None:
+                results[index] = self._build_result(file_path, language, types, None)
+                continue
+            batch[cache_key] = (content, types, [index])
+        
+        for language, batch in pending.items():
+            cache_keys = list(batch)
+            batch_paths = [Path(file_paths[batch[key][2][0]]) for key in cache_keys]
+            extracted_batch = self._extractor_for(language).extract_batch(
+                batch_paths, [batch[key][0] for key in cache_keys]
+            )
+            for cache_key, extracted in zip(cache_keys, extracted_batch):
+                _, types, indices = batch[cache_key]
+                result = self._build_result(file_paths[indices[0]], language, types, extracted)
+                self._store_cached_analysis(cache_key, result)
+                for index in indices:
+                    results[index] = self._result_for_path(result, file_paths[index])
+        
+        return results
+    
+    def analyze_bytes(
+        self,
+        data: bytes,
+        filename_hint: str,
+        extraction_types: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Analyze in-memory source without a filesystem round-trip.
         
+        Args:
+            data: UTF-8 encoded source
+            filename_hint: File name used for language detection and reported
+                           as metadata.file_path; it does not need to exist
+            extraction_types: As for analyze()
+        
+        Returns:
+            Same structure as analyze(). Shares analyze()'s content cache, so
+            bytes identical to an already analyzed file are not re-extracted.
+        """
+        language = self.detect_language(filename_hint)
         if not language:
-            return {
-                "language_detected": None,
-                "metadata": {
-                    "file_path": file_path,
-                    "extraction_errors": [f"Unsupported file type: {path.suffix}"],
-                    "extractor_version": "0.2.0",
-                    "partial": True
-                },
-                "extraction_errors": [f"Cannot extract from {path.suffix} files"]
-            }
-        
-        if extraction_types is None:
-            # Perform all applicable extractions
-            if language == 'sql':
-                extraction_types = ['sql_tables']
-            else:
-                extraction_types = ['methods', 'classes', 'imports']
+            return self._unsupported_result(filename_hint)
+        
+        types = self._resolve_extraction_types(language, extraction_types)
+        cache_key = (hashlib.sha256(data).hexdigest(), language, EXTRACTOR_VERSION, tuple(sorted(types)))
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            return self._result_for_path(cached, filename_hint)
+        
+        content = self._decode_source(data, filename_hint)
+        if content is None:
+            return self._build_result(filename_hint, language, types, None)
+        
+        extracted = self._extractor_for(language).extract_content(content, Path(filename_hint))
+        result = self._build_result(filename_hint, language, types, extracted)
+        self._store_cached_analysis(cache_key, result)
+        return self._result_for_path(result, filename_hint)
+    
+    def _extractor_for(self, language: str):
+        """Extractor instance for a detected language."""
+        return self.csharp_extractor if language == 'csharp' else self.sql_extractor
+    
+    @staticmethod
+    def _decode_source(data: bytes, file_path: str) -> Optional[str]:
+        """Decode UTF-8 source, or None (logged) if it isn't valid UTF-8."""
+        try:
+            # Same newline handling as the extractors' text-mode file reads
+            return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        except UnicodeDecodeError as e:
+            logger.error(f"Error decoding {file_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _resolve_extraction_types(language: str, extraction_types: Optional[List[str]]) -> List[str]:
+        """Requested extraction types, or all applicable ones for the language."""
+        if extraction_types is not None:
+            return extraction_types
+        return ['sql_tables'] if language == 'sql' else ['methods', 'classes', 'imports']
+    
+    @staticmethod
+    def _unsupported_result(file_path: str) -> Dict[str, Any]:
+        """analyze() result for a file with no matching extractor."""
+        suffix = Path(file_path).suffix
+        return {
+            "language_detected": None,
+            "metadata": {
+                "file_path": file_path,
+                "extraction_errors": [f"Unsupported file type: {suffix}"],
+                "extractor_version": EXTRACTOR_VERSION,
+                "partial": True
+            },
+            "extraction_errors": [f"Cannot extract from {suffix} files"]
+        }
+    
+    @staticmethod
+    def _result_for_path(result: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+        """Copy of a (possibly cached) result reporting the given path.
+        
+        Identical content may live at several paths; report the one asked for.
+        """
+        result = copy.deepcopy(result)
+        result["metadata"]["file_path"] = file_path
+        return result
+    
+    def _build_result(
+        self,
+        file_path: str,
+        language: str,
+        extraction_types: List[str],
+        extracted: Optional[ExtractedData]
+    ) -> Dict[str, Any]:
+        """Format one file's extracted data into an analyze() result.
+        
+        extracted is None when the file could not be read.
+        """
+        extraction_errors = []
         
         result = {
             "language_detected": language,
             "metadata": {
                 "file_path": file_path,
                 "language": language,
-                "extractor_version": "0.2.0",
+                "extractor_version": EXTRACTOR_VERSION,
                 "partial": False
             },
             "extraction_errors": []
@@ -225,7 +427,7 @@ class CodeAnalyzer:
         # Perform requested extractions
         if 'methods' in extraction_types:
             try:
-                methods = self.extract_methods(file_path)
+                methods = self._format_methods(extracted.methods) if extracted else []
                 result['methods'] = methods
                 if methods:
                     had_successful_extraction = True
@@ -234,7 +436,7 @@ class CodeAnalyzer:
         
         if 'classes' in extraction_types:
             try:
-                classes = self.extract_classes(file_path)
+                classes = self._format_classes(extracted.classes, extracted.raw_data) if extracted else []
                 result['classes'] = classes
                 if classes:
                     had_successful_extraction = True
@@ -243,7 +445,7 @@ class CodeAnalyzer:
         
         if 'imports' in extraction_types:
             try:
-                imports = self.extract_imports(file_path)
+                imports = self._format_imports(extracted.dependencies) if extracted else []
                 result['imports'] = imports
                 if imports:
                     had_successful_extraction = True
@@ -252,7 +454,7 @@ class CodeAnalyzer:
         
         if 'sql_tables' in extraction_types:
             try:
-                tables = self.extract_sql_tables(file_path)
+                tables = self._format_tables(extracted.tables) if extracted and language == 'sql' else []
                 result['sql_tables'] = tables
                 if tables:
                     had_successful_extraction = True
@@ -270,6 +472,65 @@ class CodeAnalyzer:
         
         return result
     
+    def _get_cached_analysis(self, cache_key: Tuple) -> Optional[Dict[str, Any]]:
+        """Look up an analyze() result in memory, then in the on-disk cache."""
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return cached
+        if self._cache_dir is None:
+            return None
+        
+        cache_file = self._cache_file(cache_key)
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        self._remember_analysis(cache_key, cached)
+        return cached
+    
+    def _store_cached_analysis(self, cache_key: Tuple, result: Dict[str, Any]) -> None:
+        """Memoize an analyze() result and persist it if a cache directory is configured."""
+        self._remember_analysis(cache_key, result)
+        if self._cache_dir is None:
+            return
+        
+        tmp_path = None
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to temp, then rename, so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, self._cache_file(cache_key))
+            tmp_path = None
+        except (OSError, TypeError, ValueError) as e:
+            # The in-memory entry still serves this process; only persistence is skipped
+            logger.warning(f"Could not persist analysis cache entry: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    def _remember_analysis(self, cache_key: Tuple, result: Dict[str, Any]) -> None:
+        """Add a result to the in-memory LRU, evicting the oldest past the size limit."""
+        self._analysis_cache[cache_key] = result
+        self._analysis_cache.move_to_end(cache_key)
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_MAXSIZE:
+            self._analysis_cache.popitem(last=False)
+    
+    def _cache_file(self, cache_key: Tuple) -> Path:
+        """On-disk location of a cache entry."""
+        digest, language, _, extraction_types = cache_key
+        name = hashlib.sha256(
+            f"{digest}:{language}:{_disk_cache_version()}:{','.join(extraction_types)}".encode('utf-8')
+        ).hexdigest()
+        return self._cache_dir / f"{name}.json"
+    
     # Private formatting methods
     
     @staticmethod
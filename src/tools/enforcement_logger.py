@@ -368,6 +368,18 @@ class EnforcementLogger:
         """
         return self.events.copy()
     
+    def get_events_since(self, start_index: int) -> List[LogEvent]:
+        """
+        Get events logged after a known position in the log.
+        
+        Args:
+            start_index: Event count captured before the operation of interest
+        
+        Returns:
+            List of LogEvent objects logged since start_index
+        """
+        return self.events[start_index:]
+    
     def get_summary(self) -> Dict[str, Any]:
         """
         Get summary of logged events.
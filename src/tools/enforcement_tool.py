@@ -21,12 +21,12 @@ from .enforcement_tool_types import (
     ValidationResult,
     ViolationSeverity,
 )
-from .template_schema_builder import TemplateSchemaBuilder
+from .template_schema_builder import TemplateSchemaBuilder, get_or_create_schema_builder
 from .document_parser import BasicDocumentParser
 from .yaml_frontmatter_generator import YAMLFrontmatterGenerator
 from .validation_engine import ValidationEngine
 from .file_writer import FileWriter, WriteResult
-from .enforcement_logger import EnforcementLogger
+from .enforcement_logger import EnforcementLogger, LogEvent
 
 
 @dataclass
@@ -43,6 +43,8 @@ class EnforceResult:
     suggested_actions: List[str] = None  # NEW: Specific actions to fix violations
     can_autofix: bool = False             # NEW: Whether auto-fix is available
     related_docs: List[str] = None       # NEW: Links to relevant documentation
+    written_content: Optional[str] = None  # Final markdown as written to disk (None if nothing written)
+    events: List[LogEvent] = None        # Log events emitted by this call only
     
     def __post_init__(self):
         """Initialize mutable defaults."""
@@ -56,6 +58,8 @@ class EnforceResult:
             self.suggested_actions = []
         if self.related_docs is None:
             self.related_docs = []
+        if self.events is None:
+            self.events = []
 
 
 class EnforcementTool:
@@ -68,6 +72,7 @@ class EnforcementTool:
         Args:
             logger: Optional EnforcementLogger for audit trail. If not provided, creates internal one.
         """
+        # Own builder and default resolver; built schemas are still shared by (template name, checksum)
         self.schema_builder = TemplateSchemaBuilder()
         self.document_parser = BasicDocumentParser()
         self.yaml_generator = YAMLFrontmatterGenerator()
@@ -104,8 +109,37 @@ class EnforcementTool:
             template_content: Optional pre-loaded template content (if not provided, loads from resources)
         
         Returns:
-            EnforceResult with validation status, confidence, file path, errors
+            EnforceResult with validation status, confidence, file path, errors,
+            and the log events emitted by this call
         """
+        events_start = len(self.logger.events)
+        result = self._validate_and_write(
+            generated_markdown,
+            template_name,
+            output_path,
+            file_metadata,
+            config,
+            update_mode,
+            overwrite,
+            dry_run,
+            template_content,
+        )
+        result.events = self.logger.get_events_since(events_start)
+        return result
+    
+    def _validate_and_write(
+        self,
+        generated_markdown: str,
+        template_name: str,
+        output_path: str,
+        file_metadata: FileMetadata,
+        config: Dict[str, Any],
+        update_mode: str,
+        overwrite: bool,
+        dry_run: bool,
+        template_content: Optional[str],
+    ) -> EnforceResult:
+        """Run the enforcement steps for validate_and_write()."""
         errors = []
         
         # Step 1: Load or use provided template content
@@ -226,7 +260,8 @@ class EnforcementTool:
                 file_path=write_result.file_path,
                 confidence=validation_result.confidence,
                 write_warnings=write_result.warnings,
-                summary=f"Documentation validated and written successfully to {write_result.file_path}"
+                summary=f"Documentation validated and written successfully to {write_result.file_path}",
+                written_content=generated_markdown
             )
         
         else:
@@ -290,7 +325,6 @@ def enforce_and_fix(
     enforce_section_order = enforcement_cfg.get("enforceSectionOrder", True)
     auto_fix_enabled = enforcement_cfg.get("autoFixEnabled", True)
 
-    from .template_schema_builder import get_or_create_schema_builder
     schema_builder = get_or_create_schema_builder(resource_manager)
     parser = BasicDocumentParser()
     yaml_generator = YAMLFrontmatterGenerator()
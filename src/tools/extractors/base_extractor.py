@@ -211,6 +211,48 @@ class BaseExtractor(ABC):
         """
         pass
     
+    def extract_content(self, content: str, file_path: Path) -> ExtractedData:
+        """
+        Extract information from source already in memory.
+        
+        Extractors that can parse without reading the file override this.
+        
+        Args:
+            content: Source text
+            file_path: Path recorded on the result; nothing is read from disk
+            
+        Returns:
+            ExtractedData object containing parsed information
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} cannot extract from in-memory source")
+    
+    def extract_batch(
+        self,
+        file_paths: List[Path],
+        contents: Optional[List[str]] = None
+    ) -> List[ExtractedData]:
+        """
+        Extract information from several source files.
+        
+        Subclasses can override this to share setup across a batch. A failure
+        in one file is recorded on its ExtractedData and does not stop the batch.
+        
+        Args:
+            file_paths: Paths to the source files
+            contents: Source already read from those paths, in the same order.
+                      When given, it is parsed with extract_content() and the
+                      files are not read again.
+            
+        Returns:
+            One ExtractedData per path, in the same order
+        """
+        if contents is None:
+            return [self.safe_extract(file_path) for file_path in file_paths]
+        return [
+            self._safe_extract_content(content, file_path)
+            for file_path, content in zip(file_paths, contents)
+        ]
+    
     def safe_extract(self, file_path: Path) -> ExtractedData:
         """
         Safely extract information, catching and logging errors.
@@ -224,10 +266,20 @@ class BaseExtractor(ABC):
         try:
             return self.extract(file_path)
         except Exception as e:
-            # Return minimal data with error recorded
-            data = ExtractedData(
-                language=self.__class__.__name__.replace('Extractor', ''),
-                file_path=str(file_path)
-            )
-            data.extraction_errors.append(f"Failed to extract from {file_path}: {str(e)}")
-            return data
+            return self._failed_extraction(file_path, e)
+    
+    def _safe_extract_content(self, content: str, file_path: Path) -> ExtractedData:
+        """extract_content() with the same error handling as safe_extract()."""
+        try:
+            return self.extract_content(content, file_path)
+        except Exception as e:
+            return self._failed_extraction(file_path, e)
+    
+    def _failed_extraction(self, file_path: Path, error: Exception) -> ExtractedData:
+        """Return minimal data with the error recorded."""
+        data = ExtractedData(
+            language=self.__class__.__name__.replace('Extractor', ''),
+            file_path=str(file_path)
+        )
+        data.extraction_errors.append(f"Failed to extract from {file_path}: {str(error)}")
+        return data
@@ -29,12 +29,46 @@ Key legacy capabilities:
 import re
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
 from enum import Enum
 
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import; every extract_* call runs them over the whole file
+# Exception throws that indicate business rules, paired with how to read group 2
+# PHASE 10.1: Improved patterns to capture full exception messages (including internal quotes)
+_EXCEPTION_PATTERNS = [
+    (re.compile(r'throw\s+new\s+(\w*Exception)\s*\(\s*"([^"]+)"', re.IGNORECASE), 'exception'),  # Double quotes
+    (re.compile(r"throw\s+new\s+(\w*Exception)\s*\(\s*'([^']+)'", re.IGNORECASE), 'exception_single'),  # Single quotes
+    (re.compile(r'throw\s+new\s+(\w+Exception)\s*\(\s*\$"([^"]+)"', re.IGNORECASE), 'exception_interpolated'),  # Interpolated strings
+    (re.compile(r'throw\s+new\s+(ArgumentNullException)\s*\(\s*nameof\s*\(\s*(\w+)\s*\)', re.IGNORECASE), 'argument_null'),
+]
+# Every exception pattern starts here, so only these offsets are tried against them
+_THROW_NEW_RE = re.compile(r'throw\s+new\s+', re.IGNORECASE)
+# Pattern: Find public async Task methods (likely service operations)
+# Matches both Task<T> and Task (void)
+_SERVICE_METHOD_RE = re.compile(r'public\s+async\s+Task(?:<[\w<>]+>)?\s+(\w+)\s*\([^)]*\)')
+_NULL_CHECK_RE = re.compile(
+    r'if\s*\(\s*(\w+)\s*==\s*null\s*\)[\s\S]*?throw\s+new\s+\w+Exception\s*\(["\']([^"\']+)["\']'
+)
+_STRING_CHECK_RE = re.compile(r'if\s*\(\s*string\.IsNullOrWhiteSpace\(([^)]+)\)\s*\)[\s\S]*?throw')
+# Pattern: // BR: Description or // Business Rule: Description
+_RULE_COMMENT_RE = re.compile(r'//\s*(?:BR|Business Rule):\s*(.+?)(?:\n|$)', re.IGNORECASE)
+# DataAnnotations attributes (allow other attributes in between)
+_REQUIRED_ATTRIBUTE_RE = re.compile(
+    r"\[Required(?:\([^)]*ErrorMessage\s*=\s*[\"']([^\"']+)[\"'])?[^)]*\)?\][^\w]*(?:\[[^\]]+\][^\w]*)*public\s+\w+\s+(\w+)",
+    re.DOTALL
+)
+_STRING_LENGTH_ATTRIBUTE_RE = re.compile(
+    r"\[StringLength\((\d+)(?:,\s*MinimumLength\s*=\s*(\d+))?[^)]*\)\][^\w]*(?:\[[^\]]+\][^\w]*)*public\s+string\s+(\w+)",
+    re.DOTALL
+)
+_RANGE_ATTRIBUTE_RE = re.compile(
+    r"\[Range\(([^,]+),\s*([^,)]+)(?:,\s*ErrorMessage\s*=\s*[\"']([^\"']+)[\"'])?[^)]*\)\][^\w]*(?:\[[^\]]+\][^\w]*)*public\s+\w+\s+(\w+)",
+    re.DOTALL
+)
+
 
 class RuleType(Enum):
     """Types of business rules."""
@@ -45,7 +79,7 @@ class RuleType(Enum):
     DATA_INTEGRITY = "data_integrity"  # From database constraints
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BusinessRule:
     """Represents a business rule extracted from code."""
     description: str
@@ -56,7 +90,7 @@ class BusinessRule:
     source_location: Optional[str] = None
     
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UseCase:
     """Represents a use case/scenario for the service."""
     title: str
@@ -67,7 +101,7 @@ class UseCase:
     postconditions: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FAQItem:
     """Represents a frequently asked question."""
     question: str
@@ -75,20 +109,24 @@ class FAQItem:
     category: str = "General"  # "Error Handling", "Validation", "Business Logic", etc.
 
 
+class _ExceptionThrow(NamedTuple):
+    """One exception throw matched by an _EXCEPTION_PATTERNS entry."""
+    exception_type: str
+    message_or_param: str
+    pattern_type: str
+    snippet: str
+
+
 class BusinessRuleExtractor:
     """Extracts business rules, use cases, and FAQ items from C# source code."""
     
     def __init__(self):
         self.logger = logger
         
-        # Exception patterns that indicate business rules
-        # PHASE 10.1: Improved patterns to capture full exception messages (including internal quotes)
-        self.exception_patterns = [
-            (r'throw\s+new\s+(\w*Exception)\s*\(\s*"([^"]+)"', 'exception'),  # Double quotes
-            (r"throw\s+new\s+(\w*Exception)\s*\(\s*'([^']+)'", 'exception_single'),  # Single quotes
-            (r'throw\s+new\s+(\w+Exception)\s*\(\s*\$"([^"]+)"', 'exception_interpolated'),  # Interpolated strings
-            (r'throw\s+new\s+(ArgumentNullException)\s*\(\s*nameof\s*\(\s*(\w+)\s*\)', 'argument_null'),
-        ]
+        # Exception patterns that indicate business rules (compiled, see _EXCEPTION_PATTERNS)
+        self.exception_patterns = _EXCEPTION_PATTERNS
+        # Last (source_code, throws) scanned; rules and FAQ items read the same throws
+        self._exception_throws: Optional[Tuple[str, List[_ExceptionThrow]]] = None
         
         # Validation patterns
         self.validation_patterns = [
@@ -147,11 +185,7 @@ class BusinessRuleExtractor:
         """
         use_cases = []
         
-        # Pattern: Find public async Task methods (likely service operations)
-        # Matches both Task<T> and Task (void)
-        method_pattern = r'public\s+async\s+Task(?:<[\w<>]+>)?\s+(\w+)\s*\([^)]*\)'
-        
-        for match in re.finditer(method_pattern, source_code):
+        for match in _SERVICE_METHOD_RE.finditer(source_code):
             method_name = match.group(1)
             
             # Infer use case from method name
@@ -176,21 +210,17 @@ class BusinessRuleExtractor:
         faq_items = []
         
         # Extract from exception messages
-        for pattern, pattern_type in self.exception_patterns:
-            for match in re.finditer(pattern, source_code, re.IGNORECASE):
-                exception_type = match.group(1)
-                message_or_param = match.group(2)
-                
-                # Handle ArgumentNullException with nameof() separately
-                if pattern_type == 'argument_null':
-                    message = f"{message_or_param} is required"
-                else:
-                    message = message_or_param
-                
-                # Generate FAQ from exception
-                faq = self._generate_faq_from_exception(exception_type, message)
-                if faq:
-                    faq_items.append(faq)
+        for exception_type, message_or_param, pattern_type, _ in self._find_exception_throws(source_code):
+            # Handle ArgumentNullException with nameof() separately
+            if pattern_type == 'argument_null':
+                message = f"{message_or_param} is required"
+            else:
+                message = message_or_param
+            
+            # Generate FAQ from exception
+            faq = self._generate_faq_from_exception(exception_type, message)
+            if faq:
+                faq_items.append(faq)
         
         # Extract from validation error messages
         faq_items.extend(self._extract_faq_from_validations(source_code))
@@ -202,55 +232,80 @@ class BusinessRuleExtractor:
         """Extract business rules from exception throws."""
         rules = []
         
-        for pattern, pattern_type in self.exception_patterns:
-            for match in re.finditer(pattern, source_code, re.IGNORECASE):
-                exception_type = match.group(1)
-                message_or_param = match.group(2)
-                
-                # Handle ArgumentNullException with nameof() separately
-                if pattern_type == 'argument_null':
-                    rule_type = RuleType.VALIDATION
-                    description = f"{message_or_param} parameter must not be null"
-                    violation = "400 BadRequest response"
-                # Determine rule type from exception name for regular exceptions
-                elif 'duplicate' in exception_type.lower() or 'conflict' in exception_type.lower():
-                    rule_type = RuleType.CONSTRAINT
-                    description = f"Uniqueness constraint: {message_or_param}"
-                    violation = "409 Conflict response"
-                elif 'notfound' in exception_type.lower():
-                    rule_type = RuleType.CONSTRAINT
-                    description = f"Existence requirement: {message_or_param}"
-                    violation = "404 NotFound response"
-                elif 'argument' in exception_type.lower():
-                    rule_type = RuleType.VALIDATION
-                    description = f"Parameter validation: {message_or_param}"
-                    violation = "400 BadRequest response"
-                elif 'invalidoperation' in exception_type.lower():
-                    rule_type = RuleType.INVARIANT
-                    description = f"Business invariant: {message_or_param}"
-                    violation = "Operation fails with error"
-                else:
-                    rule_type = RuleType.CONSTRAINT
-                    description = message_or_param
-                    violation = f"{exception_type} thrown"
-                
-                rule = BusinessRule(
-                    description=description,
-                    rule_type=rule_type,
-                    violation_consequence=violation,
-                    code_snippet=match.group(0)
-                )
-                rules.append(rule)
+        for exception_type, message_or_param, pattern_type, snippet in self._find_exception_throws(source_code):
+            # Handle ArgumentNullException with nameof() separately
+            if pattern_type == 'argument_null':
+                rule_type = RuleType.VALIDATION
+                description = f"{message_or_param} parameter must not be null"
+                violation = "400 BadRequest response"
+            # Determine rule type from exception name for regular exceptions
+            elif 'duplicate' in exception_type.lower() or 'conflict' in exception_type.lower():
+                rule_type = RuleType.CONSTRAINT
+                description = f"Uniqueness constraint: {message_or_param}"
+                violation = "409 Conflict response"
+            elif 'notfound' in exception_type.lower():
+                rule_type = RuleType.CONSTRAINT
+                description = f"Existence requirement: {message_or_param}"
+                violation = "404 NotFound response"
+            elif 'argument' in exception_type.lower():
+                rule_type = RuleType.VALIDATION
+                description = f"Parameter validation: {message_or_param}"
+                violation = "400 BadRequest response"
+            elif 'invalidoperation' in exception_type.lower():
+                rule_type = RuleType.INVARIANT
+                description = f"Business invariant: {message_or_param}"
+                violation = "Operation fails with error"
+            else:
+                rule_type = RuleType.CONSTRAINT
+                description = message_or_param
+                violation = f"{exception_type} thrown"
+            
+            rule = BusinessRule(
+                description=description,
+                rule_type=rule_type,
+                violation_consequence=violation,
+                code_snippet=snippet
+            )
+            rules.append(rule)
         
         return rules
     
+    def _find_exception_throws(self, source_code: str) -> List[_ExceptionThrow]:
+        """Match exception_patterns against source_code, reusing the last scan.
+        
+        extract_business_rules and extract_faq_items both read the throws of
+        the same file, so the second call skips the regex passes. The file is
+        swept once for 'throw new' and each pattern is only tried at those
+        offsets; results keep the per-pattern order of a finditer per pattern.
+        """
+        if self._exception_throws is not None and self._exception_throws[0] == source_code:
+            return self._exception_throws[1]
+        
+        per_pattern: List[List[_ExceptionThrow]] = [[] for _ in self.exception_patterns]
+        # A pattern's matches never overlap, as with finditer
+        match_ends = [0] * len(self.exception_patterns)
+        for throw_site in _THROW_NEW_RE.finditer(source_code):
+            pos = throw_site.start()
+            for i, (pattern, pattern_type) in enumerate(self.exception_patterns):
+                if pos < match_ends[i]:
+                    continue
+                match = pattern.match(source_code, pos)
+                if match:
+                    per_pattern[i].append(
+                        _ExceptionThrow(match.group(1), match.group(2), pattern_type, match.group(0))
+                    )
+                    match_ends[i] = match.end()
+        
+        throws = [throw for matches in per_pattern for throw in matches]
+        self._exception_throws = (source_code, throws)
+        return throws
+    
     def _extract_from_validations(self, source_code: str) -> List[BusinessRule]:
         """Extract business rules from validation patterns."""
         rules = []
         
         # Check for null validation
-        null_check_pattern = r'if\s*\(\s*(\w+)\s*==\s*null\s*\)[\s\S]*?throw\s+new\s+\w+Exception\s*\(["\']([^"\']+)["\']'
-        for match in re.finditer(null_check_pattern, source_code):
+        for match in _NULL_CHECK_RE.finditer(source_code):
             param_name = match.group(1)
             message = match.group(2)
             
@@ -263,8 +318,7 @@ class BusinessRuleExtractor:
             rules.append(rule)
         
         # Check for string validation
-        string_check_pattern = r'if\s*\(\s*string\.IsNullOrWhiteSpace\(([^)]+)\)\s*\)[\s\S]*?throw'
-        for match in re.finditer(string_check_pattern, source_code):
+        for match in _STRING_CHECK_RE.finditer(source_code):
             param_name = match.group(1)
             
             rule = BusinessRule(
@@ -282,8 +336,7 @@ class BusinessRuleExtractor:
         rules = []
         
         # Pattern: // BR: Description or // Business Rule: Description
-        comment_pattern = r'//\s*(?:BR|Business Rule):\s*(.+?)(?:\n|$)'
-        for match in re.finditer(comment_pattern, source_code, re.IGNORECASE):
+        for match in _RULE_COMMENT_RE.finditer(source_code):
             description = match.group(1).strip()
             
             rule = BusinessRule(
@@ -300,8 +353,7 @@ class BusinessRuleExtractor:
         rules = []
         
         # [Required] attribute (allow other attributes in between)
-        required_pattern = r"\[Required(?:\([^)]*ErrorMessage\s*=\s*[\"']([^\"']+)[\"'])?[^)]*\)?\][^\w]*(?:\[[^\]]+\][^\w]*)*public\s+\w+\s+(\w+)"
-        for match in re.finditer(required_pattern, source_code, re.DOTALL):
+        for match in _REQUIRED_ATTRIBUTE_RE.finditer(source_code):
             error_msg = match.group(1)
             property_name = match.group(2)
             
@@ -316,8 +368,7 @@ class BusinessRuleExtractor:
             rules.append(rule)
         
         # [StringLength] attribute (allow other attributes in between)
-        length_pattern = r"\[StringLength\((\d+)(?:,\s*MinimumLength\s*=\s*(\d+))?[^)]*\)\][^\w]*(?:\[[^\]]+\][^\w]*)*public\s+string\s+(\w+)"
-        for match in re.finditer(length_pattern, source_code, re.DOTALL):
+        for match in _STRING_LENGTH_ATTRIBUTE_RE.finditer(source_code):
             max_length = match.group(1)
             min_length = match.group(2)
             property_name = match.group(3)
@@ -335,8 +386,7 @@ class BusinessRuleExtractor:
             rules.append(rule)
         
         # [Range] attribute (allow ErrorMessage parameter and other attributes)
-        range_pattern = r"\[Range\(([^,]+),\s*([^,)]+)(?:,\s*ErrorMessage\s*=\s*[\"']([^\"']+)[\"'])?[^)]*\)\][^\w]*(?:\[[^\]]+\][^\w]*)*public\s+\w+\s+(\w+)"
-        for match in re.finditer(range_pattern, source_code, re.DOTALL):
+        for match in _RANGE_ATTRIBUTE_RE.finditer(source_code):
             min_val = match.group(1).strip()
             max_val = match.group(2).strip()
             error_msg = match.group(3)
@@ -20,6 +20,30 @@ from .dto_extractor import DTOExtractor
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import; extraction runs them for every file
+# Pattern: namespace X.Y.Z; or namespace X.Y.Z {}
+_NAMESPACE_RE = re.compile(r'^\s*namespace\s+([\w\.]+)\s*[;{]', re.MULTILINE)
+# Pattern: public class ClassName : BaseClass, IInterface
+_CLASS_RE = re.compile(r'public\s+(?:sealed\s+)?(?:abstract\s+)?class\s+(\w+)\s*(?::\s*([^\{]+))?')
+# PHASE 10.2 FIX: Improved pattern to handle complex generic return types
+# Pattern: public async Task<ReturnType> MethodName(params)
+# Matches complex types like: ActionResult<PagedResponse<CourseSummaryDto>>
+_METHOD_RE = re.compile(
+    r'(public|private|protected|internal)\s+(?:(async|static)\s+)*(?:((?:[\w\.]+\s+)*(?:[\w<>,\s\.]*?)[\w>]+)\s+)?(\w+)\s*\(([^\)]*)\)'
+)
+# Parameter attributes such as [FromBody]
+_PARAM_ATTRIBUTE_RE = re.compile(r'\[[\w\(\)]+\]')
+_CONTROLLER_BASE_RE = re.compile(r':\s*\w*Controller')
+_ROUTE_ATTRIBUTE_RE = re.compile(r'\[Route\(["\']([^"\']+)["\']\)\]')
+# First string argument of an attribute, e.g. [HttpGet("{id}")]
+_ATTRIBUTE_STRING_ARG_RE = re.compile(r'\(["\']([^"\']+)["\']\)')
+_TYPEOF_RE = re.compile(r'typeof\(([^)]+)\)')
+_STATUS_CODE_RE = re.compile(r'StatusCodes\.(\w+)|(\d{3})')
+# Pattern: RuleFor(x => x.PropertyName).RuleType(value).WithMessage("message")
+_RULE_FOR_RE = re.compile(r'RuleFor\([^)]+\.(\w+)\)\.(\w+)\(([^)]*)\)(?:\.WithMessage\(["\']([^"\']+)["\']\))?')
+# Pattern: // BR-XXX: description
+_BUSINESS_RULE_COMMENT_RE = re.compile(r'//\s*(BR-\w+)\s*:\s*(.+?)\n')
+
 
 class CSharpExtractor(BaseExtractor):
     """Extractor for C# source code."""
@@ -39,6 +63,13 @@ class CSharpExtractor(BaseExtractor):
         except Exception as e:
             raise Exception(f"Failed to read file: {e}")
         
+        return self.extract_content(content, file_path)
+    
+    def extract_content(self, content: str, file_path: Path) -> ExtractedData:
+        """Extract information from C# source already in memory.
+        
+        file_path is only recorded on the result; nothing is read from disk.
+        """
         # Initialize extracted data
         data = ExtractedData(language='csharp', file_path=str(file_path))
         
@@ -130,8 +161,7 @@ class CSharpExtractor(BaseExtractor):
         
         Pattern: namespace X.Y.Z; or namespace X.Y.Z {}
         """
-        namespace_pattern = r'^\s*namespace\s+([\w\.]+)\s*[;{]'
-        match = re.search(namespace_pattern, content, re.MULTILINE)
+        match = _NAMESPACE_RE.search(content)
         if match:
             return match.group(1)
         return None
@@ -140,10 +170,7 @@ class CSharpExtractor(BaseExtractor):
         """Extract class declarations from C# code."""
         classes = []
         
-        # Pattern: public class ClassName : BaseClass, IInterface
-        class_pattern = r'public\s+(?:sealed\s+)?(?:abstract\s+)?class\s+(\w+)\s*(?::\s*([^\{]+))?'
-        
-        for match in re.finditer(class_pattern, content):
+        for match in _CLASS_RE.finditer(content):
             class_name = match.group(1)
             inheritance = match.group(2)
             
@@ -175,12 +202,7 @@ class CSharpExtractor(BaseExtractor):
         """Extract method declarations from class body."""
         methods = []
         
-        # PHASE 10.2 FIX: Improved pattern to handle complex generic return types
-        # Pattern: public async Task<ReturnType> MethodName(params)
-        # Matches complex types like: ActionResult<PagedResponse<CourseSummaryDto>>
-        method_pattern = r'(public|private|protected|internal)\s+(?:(async|static)\s+)*(?:((?:[\w\.]+\s+)*(?:[\w<>,\s\.]*?)[\w>]+)\s+)?(\w+)\s*\(([^\)]*)\)'
-        
-        for match in re.finditer(method_pattern, class_body):
+        for match in _METHOD_RE.finditer(class_body):
             visibility = match.group(1)
             modifiers = match.group(2) or ''
             return_type = (match.group(3) or '').strip() if match.group(3) else None
@@ -234,7 +256,7 @@ class CSharpExtractor(BaseExtractor):
             
             # Pattern: [FromBody] Type paramName = default
             # Remove attributes
-            param = re.sub(r'\[[\w\(\)]+\]', '', param).strip()
+            param = _PARAM_ATTRIBUTE_RE.sub('', param).strip()
             
             # Check for default value
             default_value = None
@@ -265,14 +287,14 @@ class CSharpExtractor(BaseExtractor):
         routes = []
         
         # Check if this is a controller
-        is_controller = re.search(r':\s*\w*Controller', content)
+        is_controller = _CONTROLLER_BASE_RE.search(content)
         if not is_controller:
             logger.debug(f"PHASE 10.2: File is not a controller (no : *Controller inheritance)")
             return routes
         
         # Extract controller-level route
         controller_route = ""
-        route_attr = re.search(r'\[Route\(["\']([^"\']+)["\']\)\]', content)
+        route_attr = _ROUTE_ATTRIBUTE_RE.search(content)
         if route_attr:
             controller_route = route_attr.group(1)
         
@@ -294,7 +316,7 @@ class CSharpExtractor(BaseExtractor):
                             
                             # Extract route template from attribute
                             route_template = ""
-                            route_match = re.search(r'\(["\']([^"\']+)["\']\)', attr)
+                            route_match = _ATTRIBUTE_STRING_ARG_RE.search(attr)
                             if route_match:
                                 route_template = route_match.group(1)
                             
@@ -311,7 +333,7 @@ class CSharpExtractor(BaseExtractor):
                             response_types = []
                             for attr2 in method.attributes:
                                 if 'ProducesResponseType' in attr2:
-                                    type_match = re.search(r'typeof\(([^)]+)\)', attr2)
+                                    type_match = _TYPEOF_RE.search(attr2)
                                     if type_match:
                                         response_types.append(type_match.group(1))
                             
@@ -319,7 +341,7 @@ class CSharpExtractor(BaseExtractor):
                             status_codes = []
                             for attr2 in method.attributes:
                                 if 'ProducesResponseType' in attr2:
-                                    status_match = re.search(r'StatusCodes\.(\w+)|(\d{3})', attr2)
+                                    status_match = _STATUS_CODE_RE.search(attr2)
                                     if status_match:
                                         status = status_match.group(1) or status_match.group(2)
                                         if status.isdigit():
@@ -351,10 +373,7 @@ class CSharpExtractor(BaseExtractor):
         if 'AbstractValidator' not in content:
             return validations
         
-        # Pattern: RuleFor(x => x.PropertyName).RuleType(value).WithMessage("message")
-        rule_pattern = r'RuleFor\([^)]+\.(\w+)\)\.(\w+)\(([^)]*)\)(?:\.WithMessage\(["\']([^"\']+)["\']\))?'
-        
-        for match in re.finditer(rule_pattern, content):
+        for match in _RULE_FOR_RE.finditer(content):
             field_name = match.group(1)
             rule_type = match.group(2)
             rule_value = match.group(3).strip() if match.group(3) else None
@@ -492,8 +511,7 @@ class CSharpExtractor(BaseExtractor):
         rules = []
         
         # Pattern 1: BR-*** markers in comments
-        br_pattern = r'//\s*(BR-\w+)\s*:\s*(.+?)\n'
-        for match in re.finditer(br_pattern, content):
+        for match in _BUSINESS_RULE_COMMENT_RE.finditer(content):
             rule_id = match.group(1)
             description = match.group(2).strip()
             
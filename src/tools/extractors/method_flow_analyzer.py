@@ -29,12 +29,25 @@ Key legacy capabilities:
 import re
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 
 
 logger = logging.getLogger(__name__)
 
+# Simpler pattern - find method signatures (compiled once; extract_flows scans whole files)
+_METHOD_SIGNATURE_RE = re.compile(
+    r'(?:public|private|protected|internal)?\s+(?:async\s+)?(?:virtual\s+)?(?:override\s+)?(?:static\s+)?(?:Task<?)?[\w<>]+>?\s+(\w+)\s*\([^)]*\)\s*\{',
+    re.MULTILINE
+)
+
+
+@lru_cache(maxsize=32)
+def _combined_pattern(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile a pattern list into one alternation so a text is scanned once per list."""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+
 
 class FlowStepType(Enum):
     """Types of steps in an operation flow."""
@@ -48,7 +61,7 @@ class FlowStepType(Enum):
     LOGGING = "logging"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FlowStep:
     """Represents a single step in an operation flow."""
     step_number: int
@@ -60,7 +73,7 @@ class FlowStep:
     code_snippet: Optional[str] = None
     
     
-@dataclass
+@dataclass(slots=True)
 class OperationFlow:
     """Represents the complete flow of an operation/method."""
     method_name: str
@@ -151,10 +164,7 @@ class MethodFlowAnalyzer:
         """
         flows = []
         
-        # Simpler pattern - find method signatures
-        method_sig_pattern = r'(?:public|private|protected|internal)?\s+(?:async\s+)?(?:virtual\s+)?(?:override\s+)?(?:static\s+)?(?:Task<?)?[\w<>]+>?\s+(\w+)\s*\([^)]*\)\s*\{'
-        
-        for match in re.finditer(method_sig_pattern, source_code, re.MULTILINE):
+        for match in _METHOD_SIGNATURE_RE.finditer(source_code):
             method_name = match.group(1)
             
             # Only analyze CRUD operations
@@ -313,7 +323,4 @@ class MethodFlowAnalyzer:
     
     def _contains_pattern(self, text: str, patterns: List[str]) -> bool:
         """Check if text contains any of the regex patterns."""
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return _combined_pattern(tuple(patterns)).search(text) is not None
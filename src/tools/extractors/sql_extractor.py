@@ -17,6 +17,28 @@ from .base_extractor import (
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import; extraction runs them for every column
+# Pattern: CREATE TABLE [schema].[tablename] (...)
+# This handles single-line and multi-line CREATE TABLE statements
+_CREATE_TABLE_RE = re.compile(
+    r'CREATE\s+TABLE\s+(?:\[?(\w+)\]?\.)?\[?(\w+)\]?\s*\((.*?)\)(?:\s+(?:WITH|ON).*?)?;',
+    re.IGNORECASE | re.DOTALL
+)
+# Table-level constraint definitions (CONSTRAINT, PRIMARY KEY, ...) inside a table body
+_CONSTRAINT_DEFINITION_RE = re.compile(r'^\s*(?:CONSTRAINT|PRIMARY|FOREIGN|UNIQUE|CHECK)\s+', re.IGNORECASE)
+# Entries in a column list that are constraints or keys rather than columns
+_NON_COLUMN_DEFINITION_RE = re.compile(r'^\s*(?:CONSTRAINT|PRIMARY|FOREIGN|UNIQUE|CHECK|INDEX|KEY)\s+', re.IGNORECASE)
+_BRACKETED_NAME_RE = re.compile(r'^\[([^\]]+)\]')
+_DATA_TYPE_RE = re.compile(r'(\w+)(?:\(([^)]+)\))?')
+_DEFAULT_RE = re.compile(
+    r'DEFAULT\s+([^,\s]+(?:\s+[^,\s]+)*?)(?:\s+(?:NULL|NOT|PRIMARY|FOREIGN|UNIQUE|CHECK|REFERENCES|,|$))',
+    re.IGNORECASE
+)
+_PRIMARY_KEY_RE = re.compile(r'\bPRIMARY\s+KEY\b', re.IGNORECASE)
+_REFERENCES_RE = re.compile(r'REFERENCES\s+\[?(\w+)\]?(?:\.\[?(\w+)\]?)?\s*\(\[?(\w+)\]?\)', re.IGNORECASE)
+_CHECK_RE = re.compile(r'CHECK\s*\(([^)]+)\)', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class SQLExtractor(BaseExtractor):
     """Extractor for SQL DDL source files."""
@@ -36,6 +58,13 @@ class SQLExtractor(BaseExtractor):
         except Exception as e:
             raise Exception(f"Failed to read file: {e}")
         
+        return self.extract_content(content, file_path)
+    
+    def extract_content(self, content: str, file_path: Path) -> ExtractedData:
+        """Extract information from SQL source already in memory.
+        
+        file_path is only recorded on the result; nothing is read from disk.
+        """
         # Initialize extracted data
         data = ExtractedData(language='sql', file_path=str(file_path))
         
@@ -54,11 +83,7 @@ class SQLExtractor(BaseExtractor):
         """Extract CREATE TABLE statements."""
         tables = []
         
-        # Pattern: CREATE TABLE [schema].[tablename] (...)
-        # This handles single-line and multi-line CREATE TABLE statements
-        table_pattern = r'CREATE\s+TABLE\s+(?:\[?(\w+)\]?\.)?\[?(\w+)\]?\s*\((.*?)\)(?:\s+(?:WITH|ON).*?)?;'
-        
-        for match in re.finditer(table_pattern, content, re.IGNORECASE | re.DOTALL):
+        for match in _CREATE_TABLE_RE.finditer(content):
             schema = match.group(1)
             table_name = match.group(2)
             table_body = match.group(3)
@@ -97,7 +122,7 @@ class SQLExtractor(BaseExtractor):
             col_def = col_def.strip()
             
             # Skip constraint definitions (they start with CONSTRAINT or key keywords)
-            if re.match(r'^\s*(?:CONSTRAINT|PRIMARY|FOREIGN|UNIQUE|CHECK|INDEX|KEY)\s+', col_def, re.IGNORECASE):
+            if _NON_COLUMN_DEFINITION_RE.match(col_def):
                 continue
             
             # Parse column definition
@@ -113,7 +138,7 @@ class SQLExtractor(BaseExtractor):
         
         # Pattern: [ColumnName] DataType [(size)] [NULL|NOT NULL] [DEFAULT value] [other constraints]
         # Remove brackets around column name
-        col_def = re.sub(r'^\[([^\]]+)\]', r'\1', col_def)
+        col_def = _BRACKETED_NAME_RE.sub(r'\1', col_def)
         
         # Extract column name (first word)
         parts = col_def.split(None, 1)
@@ -124,7 +149,7 @@ class SQLExtractor(BaseExtractor):
         rest = parts[1]
         
         # Extract data type (next word, may include size)
-        data_type_match = re.match(r'(\w+)(?:\(([^)]+)\))?', rest)
+        data_type_match = _DATA_TYPE_RE.match(rest)
         if not data_type_match:
             return None
         
@@ -138,20 +163,19 @@ class SQLExtractor(BaseExtractor):
         
         # Extract default value
         default_value = None
-        default_match = re.search(r'DEFAULT\s+([^,\s]+(?:\s+[^,\s]+)*?)(?:\s+(?:NULL|NOT|PRIMARY|FOREIGN|UNIQUE|CHECK|REFERENCES|,|$))', 
-                                 col_def, re.IGNORECASE)
+        default_match = _DEFAULT_RE.search(col_def)
         if default_match:
             default_value = default_match.group(1).strip()
         
         # Check for PRIMARY KEY
-        is_primary_key = bool(re.search(r'\bPRIMARY\s+KEY\b', col_def, re.IGNORECASE))
+        is_primary_key = bool(_PRIMARY_KEY_RE.search(col_def))
         
         # Check for FOREIGN KEY / REFERENCES
         is_foreign_key = False
         foreign_key_table = None
         foreign_key_column = None
         
-        fk_match = re.search(r'REFERENCES\s+\[?(\w+)\]?(?:\.\[?(\w+)\]?)?\s*\(\[?(\w+)\]?\)', col_def, re.IGNORECASE)
+        fk_match = _REFERENCES_RE.search(col_def)
         if fk_match:
             is_foreign_key = True
             # Handle schema.table or just table
@@ -172,7 +196,7 @@ class SQLExtractor(BaseExtractor):
             constraints.append('AUTO_INCREMENT')
         
         # Extract CHECK constraints
-        check_match = re.search(r'CHECK\s*\(([^)]+)\)', col_def, re.IGNORECASE)
+        check_match = _CHECK_RE.search(col_def)
         if check_match:
             constraints.append(f"CHECK ({check_match.group(1)})")
         
@@ -201,9 +225,9 @@ class SQLExtractor(BaseExtractor):
             definition = definition.strip()
             
             # Check if it's a constraint definition
-            if re.match(r'^\s*(?:CONSTRAINT|PRIMARY|FOREIGN|UNIQUE|CHECK)\s+', definition, re.IGNORECASE):
+            if _CONSTRAINT_DEFINITION_RE.match(definition):
                 # Clean up the constraint
-                constraint = re.sub(r'\s+', ' ', definition).strip()
+                constraint = _WHITESPACE_RE.sub(' ', definition).strip()
                 constraints.append(constraint)
                 logger.debug(f"Extracted constraint: {constraint[:50]}...")
         
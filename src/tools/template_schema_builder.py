@@ -9,9 +9,11 @@ Dependency: Accepts TemplateResolver (or legacy AKRResourceManager for compatibi
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, Union
 
@@ -24,6 +26,12 @@ from .enforcement_tool_types import Section, TemplateSchema
 # Persists schema cache across enforce_and_fix() calls for 70-80% speedup
 _global_schema_builder: Optional['TemplateSchemaBuilder'] = None
 
+# Schemas by (template name, content checksum), shared by every builder. A schema
+# depends only on these two, so builders with different resolvers can share it.
+# Builders get their own copy, and the least recently used entry goes past the limit.
+_SHARED_SCHEMAS_MAXSIZE = 64
+_shared_schemas: OrderedDict[tuple[str, str], TemplateSchema] = OrderedDict()
+
 
 def get_or_create_schema_builder(
     resolver: Optional[Union[TemplateResolver, AKRResourceManager]] = None,
@@ -198,15 +206,26 @@ class TemplateSchemaBuilder:
         if cached and cached.schema.checksum == checksum:
             return cached.schema
 
-        required_sections = self.get_required_sections(template_content, template_name)
-        heading_rules = self.extract_heading_hierarchy(template_content)
-        schema = TemplateSchema(
-            required_sections=required_sections,
-            heading_rules=heading_rules,
-            format_rules={},
-            template_name=template_name,
-            checksum=checksum,
-        )
+        shared_key = (template_name, checksum)
+        shared = _shared_schemas.get(shared_key)
+        if shared is None:
+            required_sections = self.get_required_sections(template_content, template_name)
+            heading_rules = self.extract_heading_hierarchy(template_content)
+            shared = TemplateSchema(
+                required_sections=required_sections,
+                heading_rules=heading_rules,
+                format_rules={},
+                template_name=template_name,
+                checksum=checksum,
+            )
+            _shared_schemas[shared_key] = shared
+            if len(_shared_schemas) > _SHARED_SCHEMAS_MAXSIZE:
+                _shared_schemas.popitem(last=False)
+        else:
+            _shared_schemas.move_to_end(shared_key)
+
+        # Copy so a caller mutating its schema can't change other builders' schemas
+        schema = copy.deepcopy(shared)
         self.cache_schema(template_name, schema)
         return schema
 
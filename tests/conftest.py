@@ -1,14 +1,17 @@
 """
 Pytest configuration and fixtures for AKR MCP Server tests.
 
-This module sets up the Python path to include the src/ directory
-and configures pytest for the project.
+The src/ directory is put on the Python path by the ``pythonpath`` option
+in pytest.ini, so test modules can import ``tools.*`` directly.
 """
 
-import sys
-from pathlib import Path
+import pytest
 
-# Add src directory to Python path so imports work correctly
-src_path = Path(__file__).parent.parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+from src.tools.code_analytics import CodeAnalyzer
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """Shared CodeAnalyzer; extractors are read-only after construction and
+    its analysis cache is keyed by file content, so tests can't interfere."""
+    return CodeAnalyzer()
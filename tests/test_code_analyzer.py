@@ -22,7 +22,7 @@ def test_code_analyzer_initialization():
     assert len(analyzer.extractors) == 3
 
 
-def test_code_analyzer_analyze_csharp():
+def test_code_analyzer_analyze_csharp(tmp_path):
     """Test analyzing a simple C# file"""
     code = """
 public class TestService
@@ -34,7 +34,7 @@ public class TestService
 }
 """
     
-    test_file = Path("test_service.cs")
+    test_file = tmp_path / "test_service.cs"
     try:
         test_file.write_text(code, encoding='utf-8')
         
@@ -50,7 +50,7 @@ public class TestService
 
 
 @pytest.mark.skip(reason="Test assertion mismatch - looking for wrong HTML comment format")
-def test_code_analyzer_populate_template():
+def test_code_analyzer_populate_template(tmp_path):
     """Test template population with extracted data"""
     template = """
 # Test Service Documentation
@@ -74,7 +74,7 @@ public class TestService
 }
 """
     
-    test_file = Path("test_populate.cs")
+    test_file = tmp_path / "test_populate.cs"
     try:
         test_file.write_text(code, encoding='utf-8')
         
@@ -101,7 +101,7 @@ def test_code_analyzer_fallback_on_error():
     assert isinstance(results, list)
 
 
-def test_code_analyzer_disabled():
+def test_code_analyzer_disabled(tmp_path):
     """Test that analyzer respects enabled=false config"""
     config = {'enabled': False}
     
@@ -112,7 +112,7 @@ public class TestService
 }
 """
     
-    test_file = Path("test_disabled.cs")
+    test_file = tmp_path / "test_disabled.cs"
     try:
         test_file.write_text(code, encoding='utf-8')
         
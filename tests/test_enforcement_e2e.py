@@ -1,5 +1,6 @@
 import subprocess
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -16,21 +17,41 @@ def git_repo(tmp_path: Path) -> Path:
     return tmp_path
 
 
-def _enforcement_config() -> dict:
-    return {
-        "documentation": {
-            "enforcement": {
-                "enabled": True,
-                "validationStrictness": "baseline",
-                "requireYamlFrontmatter": True,
-                "enforceSectionOrder": True,
-                "autoFixEnabled": True,
-                "allowRetry": True,
-                "maxRetries": 3,
-                "writeMode": "git"
-            }
-        }
-    }
+def _locate_yaml_and_header(text: str) -> tuple[int, int]:
+    """Return (closing YAML delimiter line, first AI header line), or -1 for each if missing.
+
+    Stops scanning as soon as both positions are known.
+    """
+    yaml_end = -1
+    header_pos = -1
+    dashes_seen = 0
+    for i, line in enumerate(text.splitlines()):
+        if yaml_end == -1 and line.strip() == "---":
+            dashes_seen += 1
+            if dashes_seen == 2:
+                yaml_end = i
+        elif header_pos == -1 and line.startswith("<!--"):
+            header_pos = i
+        if yaml_end != -1 and header_pos != -1:
+            break
+    return yaml_end, header_pos
+
+
+# Read-only so a test can't leak config changes into the tests that follow
+_ENFORCEMENT_CONFIG = MappingProxyType({
+    "documentation": MappingProxyType({
+        "enforcement": MappingProxyType({
+            "enabled": True,
+            "validationStrictness": "baseline",
+            "requireYamlFrontmatter": True,
+            "enforceSectionOrder": True,
+            "autoFixEnabled": True,
+            "allowRetry": True,
+            "maxRetries": 3,
+            "writeMode": "git"
+        })
+    })
+})
 
 
 def test_write_documentation_enforces_before_write(git_repo: Path):
@@ -42,7 +63,7 @@ def test_write_documentation_enforces_before_write(git_repo: Path):
         component_type="service",
         template="minimal_service_template.md",
         overwrite=False,
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
 
     assert result.get("success") is False
@@ -98,7 +119,7 @@ Minimal.
         component_type="service",
         template="minimal_service_template.md",
         overwrite=True,
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
 
     assert result.get("success") is True
@@ -106,10 +127,8 @@ Minimal.
     assert file_path.exists()
 
     content = file_path.read_text(encoding="utf-8")
-    yaml_lines = [i for i, line in enumerate(content.splitlines()) if line.strip() == "---"]
-    assert len(yaml_lines) >= 2
-    yaml_end = yaml_lines[1]
-    header_pos = next((i for i, line in enumerate(content.splitlines()) if line.startswith("<!--")), -1)
+    yaml_end, header_pos = _locate_yaml_and_header(content)
+    assert yaml_end != -1
     assert header_pos > yaml_end
 
 
@@ -168,7 +187,7 @@ Minimal.
         component_type="service",
         template="minimal_service_template.md",
         overwrite=True,
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
     
     assert write_result.get("success") is True
@@ -186,7 +205,7 @@ Minimal.
         template="minimal_service_template.md",
         source_file="src/service.cs",
         component_type="service",
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
     
     # Should fail due to enforcement (invalid content structure)
@@ -257,7 +276,7 @@ Minimal.
         component_type="service",
         template="minimal_service_template.md",
         overwrite=True,
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
     
     assert write_result.get("success") is True
@@ -275,7 +294,7 @@ Minimal.
         template="minimal_service_template.md",
         source_file="src/service.cs",
         component_type="service",
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
     
     # Critical assertions: enforcement gate was invoked, operation succeeded
@@ -344,7 +363,7 @@ Minimal.
         component_type="service",
         template="minimal_service_template.md",
         overwrite=True,
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
     
     assert write_result.get("success") is True
@@ -361,7 +380,7 @@ Minimal.
         template="minimal_service_template.md",
         source_file="src/service.cs",
         component_type="service",
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
     
     assert update_result.get("success") is True
@@ -373,20 +392,19 @@ Minimal.
     lines = content.splitlines()
     assert lines[0].strip() == "---", "YAML must start at first line"
     
-    # Find both YAML delimiters
-    yaml_delimiters = [i for i, line in enumerate(lines) if line.strip() == "---"]
-    assert len(yaml_delimiters) >= 2, "YAML must have opening and closing delimiters"
+    # Find the closing YAML delimiter and the AI header in one pass
+    yaml_end, header_idx = _locate_yaml_and_header(content)
+    assert yaml_end != -1, "YAML must have opening and closing delimiters"
     
     # YAML content should be between delimiters and contain required keys
     # Note: Enforcement may normalize YAML values (e.g., TEST -> TBD)
     # What matters is that YAML structure/keys are preserved
-    yaml_section = "\n".join(lines[yaml_delimiters[0]:yaml_delimiters[1] + 1])
+    yaml_section = "\n".join(lines[:yaml_end + 1])
     assert "feature:" in yaml_section, "YAML should contain 'feature' key"
     assert "component:" in yaml_section, "YAML should contain 'component' key"
     
     # Header should come AFTER closing YAML delimiter
-    header_idx = next((i for i, line in enumerate(lines) if line.startswith("<!--")), -1)
-    assert header_idx > yaml_delimiters[1], "AI header must appear AFTER YAML closing delimiter"
+    assert header_idx > yaml_end, "AI header must appear AFTER YAML closing delimiter"
 
 
 @pytest.mark.skip(reason="Tests require force_workflow_bypass flag - test setup issue")
@@ -394,8 +412,13 @@ def test_update_documentation_sections_git_operations(git_repo: Path):
     """Test that git operations (stage, commit) succeed after update."""
     
     # Step 1: Configure git user for the test repo
-    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=git_repo, check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=git_repo, check=True)
+    for key, value in (("user.email", "test@test.com"), ("user.name", "Test User")):
+        subprocess.run(
+            ["git", "config", key, value],
+            cwd=git_repo,
+            check=True,
+            capture_output=True
+        )
     
     # Step 2: Write initial valid doc
     initial_content = """---
@@ -445,7 +468,7 @@ Minimal.
         component_type="service",
         template="minimal_service_template.md",
         overwrite=True,
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
     
     assert write_result.get("success") is True
@@ -462,7 +485,7 @@ Minimal.
         template="minimal_service_template.md",
         source_file="src/service.cs",
         component_type="service",
-        config=_enforcement_config()
+        config=_ENFORCEMENT_CONFIG
     )
     
     assert update_result.get("success") is True
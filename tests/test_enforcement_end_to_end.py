@@ -4,18 +4,19 @@ End-to-end tests for enforcement tool: validate + write workflow.
 Scenarios:
 1. Valid document with all components - should pass and write
 2. Missing YAML front matter - should auto-generate and pass
-3. Sections out of order - should fail validation
-4. Missing required section - should fail validation
-5. Dry-run mode - should validate but not write
-6. Invalid output path (outside workspace) - should fail write
-7. Real Lean template - should validate correctly
-8. Real Standard template - should validate correctly
+3. Logging - should record schema, validation, and write events
+4. Dry-run mode - should validate but not write
+5. Confidence scoring - a perfect document should score close to 1.0
+6. Missing required section - should fail validation
+7. Invalid output path (outside workspace, or not .md) - should fail write
+8. Heading level jump (H1 -> H3) - should be detected
 """
 
 import os
-import tempfile
+import statistics
+import string
+import time
 from pathlib import Path
-from dataclasses import dataclass
 
 import pytest
 
@@ -23,203 +24,33 @@ from src.tools.enforcement_tool_types import FileMetadata
 from src.tools.enforcement_tool import EnforcementTool, EnforceResult
 
 
-@pytest.fixture
-def temp_workspace():
-    """Create temporary workspace for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create docs subdirectory
-        docs_dir = os.path.join(tmpdir, "docs")
-        os.makedirs(docs_dir, exist_ok=True)
-        yield tmpdir
-
-
-@pytest.fixture
-def basic_config(temp_workspace):
-    """Create basic AKR config."""
-    return {
-        "workspace_root": temp_workspace,
-        "doc_root": "docs",
-        "pathMappings": {
-            "src/**/*.cs": "docs/{name}.md"
-        }
-    }
-
-
-@pytest.fixture
-def enforcement_tool():
-    """Create enforcement tool instance."""
-    return EnforcementTool()
-
-
-@pytest.fixture
-def minimal_template():
-    """Create minimal template for testing."""
-    return """# Service Documentation
-
-## Overview
-Service description.
-
-## Architecture
-How it works.
-
-## Examples
-Code examples.
-"""
-
-
-@pytest.fixture
-def file_metadata():
-    """Create test file metadata."""
-    return FileMetadata(
-        file_path="src/services/EnrollmentService.cs",
-        component_name="EnrollmentService",
-        feature_tag="enrollment",
-        domain="Services",
-        module_name="Enrollment",
-        complexity="standard"
-    )
+# Workspace-relative target shared by the tests that expect a successful write
+OUTPUT_PATH = "docs/EnrollmentService.md"
 
-
-@pytest.mark.skip(reason="Windows symlink traversal detection in temp directory - platform-specific issue")
-class TestValidDocumentPassesAndWrites:
-    """Test 1: Valid document with all components."""
-    
-    def test_valid_document_writes_successfully(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata,
-        temp_workspace
-    ):
-        """Valid markdown with YAML should pass validation and write."""
-        # Arrange
-        markdown = """---
-feature: enrollment
-domain: Services
+# YAML front matter shared by the test documents; substitute only the fields a test varies
+YAML_FRONT_MATTER = string.Template("""---
+feature: $feature
+domain: $domain
 layer: API
-component: EnrollmentService
+component: $component
 status: deployed
 version: 1.0
 componentType: Service
 priority: TBD
-lastUpdated: 2026-02-03
+lastUpdated: $last_updated
 ---
 
-# Service Documentation
-
-## Overview
-Service description.
-
-## Architecture
-How it works.
-
-## Examples
-Code examples.
-"""
-        output_path = "docs/EnrollmentService.md"
-        
-        # Act
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
-            template_name="lean_baseline",
-            output_path=output_path,
-            file_metadata=file_metadata,
-            config=basic_config,
-            template_content=minimal_template,
-            dry_run=False
-        )
-        
-        # Assert
-        assert result.valid is True
-        assert result.file_path is not None
-        assert len(result.write_errors) == 0
-        assert os.path.exists(os.path.join(temp_workspace, output_path))
-        
-        # Verify file content
-        with open(os.path.join(temp_workspace, output_path), 'r') as f:
-            written_content = f.read()
-            assert "enrollment" in written_content
-            assert "Overview" in written_content
-
-
-@pytest.mark.skip(reason="Windows symlink traversal detection in temp directory - platform-specific issue")
-class TestMissingYAMLGenerated:
-    """Test 2: Missing YAML front matter - should auto-generate."""
-    
-    def test_missing_yaml_auto_generated(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata,
-        temp_workspace
-    ):
-        """Markdown without YAML should auto-generate YAML and pass."""
-        # Arrange
-        markdown = """# Service Documentation
-
-## Overview
-Service description.
-
-## Architecture
-How it works.
+""")
 
-## Examples
-Code examples.
-"""
-        output_path = "docs/EnrollmentService.md"
-        
-        # Act
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
-            template_name="lean_baseline",
-            output_path=output_path,
-            file_metadata=file_metadata,
-            config=basic_config,
-            template_content=minimal_template,
-            dry_run=False
-        )
-        
-        # Assert
-        assert result.valid is True
-        assert os.path.exists(os.path.join(temp_workspace, output_path))
-        
-        # Verify written file has YAML
-        with open(os.path.join(temp_workspace, output_path), 'r') as f:
-            written_content = f.read()
-            assert written_content.startswith("---")
-            assert "lastUpdated:" in written_content
-
-
-@pytest.mark.skip(reason="Windows symlink traversal detection in temp directory - platform-specific issue")
-class TestSectionOutOfOrder:
-    """Test 3: Sections out of order - should fail validation."""
-    
-    def test_sections_out_of_order_fails(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata
-    ):
-        """Markdown with sections in wrong order should fail (if order validation enabled)."""
-        # Note: Phase 1 MVP section order check compares case-insensitive section names.
-        # This test validates sections in a way the template parser will recognize as correct order.
-        # Template expects: Overview, Architecture, Examples
-        markdown = """---
-feature: enrollment
-domain: Services
-layer: API
-component: EnrollmentService
-status: deployed
-version: 1.0
-componentType: Service
-priority: TBD
-lastUpdated: 2026-02-03
----
+ENROLLMENT_FRONT_MATTER = YAML_FRONT_MATTER.substitute(
+    feature="enrollment",
+    domain="Services",
+    component="EnrollmentService",
+    last_updated="2026-02-03",
+)
 
-# Service Documentation
+# Document body matching minimal_template, without YAML front matter
+MARKDOWN_NO_YAML = """# Service Documentation
 
 ## Overview
 Service description.
@@ -230,214 +61,64 @@ How it works.
 ## Examples
 Code examples.
 """
-        output_path = "docs/EnrollmentService.md"
-        
-        # Act (this should pass - sections are in correct order)
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
-            template_name="lean_baseline",
-            output_path=output_path,
-            file_metadata=file_metadata,
-            config=basic_config,
-            template_content=minimal_template,
-            dry_run=False
-        )
-        
-        # Assert - actually this passes because sections are in order
-        assert result.valid is True
-
-
-class TestMissingRequiredSection:
-    """Test 4: Missing required section - should fail validation."""
-    
-    @pytest.mark.skip(reason="Template name mapping issue - 'lean_baseline' vs 'lean_baseline_service_template.md'")
-    def test_missing_required_section_fails(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata
-    ):
-        """Markdown missing required section should fail."""
-        # Arrange - template requires: Overview, Architecture, Examples
-        # Markdown missing: Examples
-        markdown = """---
-feature: enrollment
-domain: Services
-layer: API
-component: EnrollmentService
-status: deployed
-version: 1.0
-componentType: Service
-priority: TBD
-lastUpdated: 2026-02-03
----
-
-# Service Documentation
 
-## Overview
-Service description.
-
-## Architecture
-How it works.
-"""
-        output_path = "docs/EnrollmentService.md"
-        
-        # Act
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
-            template_name="lean_baseline",
-            output_path=output_path,
-            file_metadata=file_metadata,
-            config=basic_config,
-            template_content=minimal_template,
-            dry_run=False
-        )
-        
-        # Assert
-        assert result.valid is False
-        assert len(result.validation_errors) > 0
-        assert any("section" in err.lower() for err in result.validation_errors)
+# Valid document matching minimal_template, with complete YAML front matter
+VALID_MARKDOWN = ENROLLMENT_FRONT_MATTER + MARKDOWN_NO_YAML
 
+# Missing the required "Examples" section
+MARKDOWN_MISSING_EXAMPLES = VALID_MARKDOWN.split("\n## Examples")[0]
 
-class TestDryRunMode:
-    """Test 5: Dry-run mode - validates but doesn't write."""
-    
-    def test_dry_run_validates_but_no_write(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata,
-        temp_workspace
-    ):
-        """Dry-run should validate but not write file."""
-        # Arrange
-        markdown = """---
-feature: enrollment
-domain: Services
-layer: API
-component: EnrollmentService
-status: deployed
-version: 1.0
-componentType: Service
-priority: TBD
-lastUpdated: 2026-02-03
----
+# H1 -> H3 heading level jump
+MARKDOWN_BAD_HEADING = ENROLLMENT_FRONT_MATTER + MARKDOWN_NO_YAML.replace(
+    "## Overview\nService description.",
+    "### Overview\n(skipped H2, should be invalid)",
+)
 
-# Service Documentation
 
-## Overview
-Service description.
+def _workspace_config(workspace: str) -> dict:
+    """Create basic AKR config rooted at the given workspace."""
+    return {
+        "workspace_root": workspace,
+        "doc_root": "docs",
+        "pathMappings": {
+            "src/**/*.cs": "docs/{name}.md"
+        }
+    }
 
-## Architecture
-How it works.
 
-## Examples
-Code examples.
-"""
-        output_path = "docs/EnrollmentService.md"
-        full_path = os.path.join(temp_workspace, output_path)
-        
-        # Act
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
-            template_name="lean_baseline",
-            output_path=output_path,
-            file_metadata=file_metadata,
-            config=basic_config,
-            template_content=minimal_template,
-            dry_run=True
-        )
-        
-        # Assert
-        assert result.valid is True
-        assert result.dry_run is True
-        assert not os.path.exists(full_path)  # File should NOT be written
-        assert "Would write" in result.summary
+@pytest.fixture(scope="module")
+def temp_workspace(tmp_path_factory):
+    """Create temporary workspace shared by the tests in this module.
 
+    tmp_path_factory gives each pytest-xdist worker its own base directory,
+    so the workspace is worker-local without keying on worker_id.
+    """
+    # No docs/ pre-creation: FileWriter creates missing parent directories on write
+    return str(tmp_path_factory.mktemp("ws"))
 
-class TestInvalidOutputPath:
-    """Test 6: Invalid output path (outside workspace)."""
-    
-    def test_invalid_path_outside_workspace_fails(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata,
-        temp_workspace
-    ):
-        """Output path outside workspace should fail."""
-        # Arrange
-        markdown = """---
-feature: enrollment
-domain: Services
-layer: API
-component: EnrollmentService
-status: deployed
-version: 1.0
-componentType: Service
-priority: TBD
-lastUpdated: 2026-02-03
----
 
-# Service Documentation
+@pytest.fixture
+def output_md(tmp_path):
+    """Absolute OUTPUT_PATH inside a fresh per-test workspace (tmp_path)."""
+    return tmp_path / OUTPUT_PATH
 
-## Overview
-Service description.
 
-## Architecture
-How it works.
+@pytest.fixture(scope="module")
+def basic_config(temp_workspace):
+    """Create basic AKR config."""
+    return _workspace_config(temp_workspace)
 
-## Examples
-Code examples.
-"""
-        # Try to write outside workspace
-        output_path = "../../../etc/passwd.md"
-        
-        # Act
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
-            template_name="lean_baseline",
-            output_path=output_path,
-            file_metadata=file_metadata,
-            config=basic_config,
-            template_content=minimal_template,
-            dry_run=False
-        )
-        
-        # Assert
-        assert result.valid is False
-        assert len(result.write_errors) > 0
-        assert any("parent" in err.lower() or "outside" in err.lower() for err in result.write_errors)
 
+@pytest.fixture(scope="session")
+def enforcement_tool():
+    """Create enforcement tool instance (one per xdist worker process)."""
+    return EnforcementTool()
 
-class TestInvalidPathNoMDExtension:
-    """Test 6b: Invalid path without .md extension."""
-    
-    def test_invalid_path_no_md_extension_fails(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata
-    ):
-        """Output path without .md extension should fail."""
-        # Arrange
-        markdown = """---
-feature: enrollment
-domain: Services
-layer: API
-component: EnrollmentService
-status: deployed
-version: 1.0
-componentType: Service
-priority: TBD
-lastUpdated: 2026-02-03
----
 
-# Service Documentation
+@pytest.fixture(scope="session")
+def minimal_template():
+    """Create minimal template for testing."""
+    return """# Service Documentation
 
 ## Overview
 Service description.
@@ -448,190 +129,305 @@ How it works.
 ## Examples
 Code examples.
 """
-        output_path = "docs/EnrollmentService.txt"
-        
-        # Act
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
-            template_name="lean_baseline",
-            output_path=output_path,
-            file_metadata=file_metadata,
-            config=basic_config,
-            template_content=minimal_template,
-            dry_run=False
-        )
-        
-        # Assert
-        assert result.valid is False
-        assert len(result.write_errors) > 0
-        assert any(".md" in err.lower() for err in result.write_errors)
 
 
-class TestLogging:
-    """Test logging functionality."""
-    
-    def test_logging_captures_events(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata,
-        temp_workspace
-    ):
-        """Logging should capture schema, validation, and write events."""
-        # Arrange
-        markdown = """---
-feature: enrollment
-domain: Services
-layer: API
-component: EnrollmentService
-status: deployed
-version: 1.0
-componentType: Service
-priority: TBD
-lastUpdated: 2026-02-03
----
-
-# Service Documentation
-
-## Overview
-Service description.
+@pytest.fixture(scope="session")
+def file_metadata():
+    """Create test file metadata."""
+    return FileMetadata(
+        file_path="src/services/EnrollmentService.cs",
+        component_name="EnrollmentService",
+        feature_tag="enrollment",
+        domain="Services",
+        module_name="Enrollment",
+        complexity="standard"
+    )
 
-## Architecture
-How it works.
 
-## Examples
-Code examples.
-"""
-        output_path = "docs/EnrollmentService.md"
-        
-        # Act
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
-            template_name="lean_baseline",
-            output_path=output_path,
-            file_metadata=file_metadata,
-            config=basic_config,
-            template_content=minimal_template,
-            dry_run=False
-        )
-        
-        # Assert
-        logger = enforcement_tool.get_logger()
-        events = logger.get_events()
-        
-        # Should have schema built, validation run, write attempt, and write success
-        assert len(events) >= 3
-        event_types = [e.event_type for e in events]
-        assert "SCHEMA_BUILT" in event_types
-        assert "VALIDATION_RUN" in event_types
-        assert "WRITE_ATTEMPT" in event_types or "WRITE_SUCCESS" in event_types
-
-
-class TestConfidenceScoring:
-    """Test confidence score calculation."""
-    
-    def test_perfect_document_has_high_confidence(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata
-    ):
-        """Perfect document should have confidence close to 1.0."""
-        # Arrange
-        markdown = """---
-feature: enrollment
-domain: Services
-layer: API
-component: EnrollmentService
-status: deployed
-version: 1.0
-componentType: Service
-priority: TBD
-lastUpdated: 2026-02-03
----
+@pytest.fixture(scope="module")
+def valid_dry_result(enforcement_tool, basic_config, minimal_template, file_metadata):
+    """Dry-run validation of VALID_MARKDOWN, computed once for assertion-only tests."""
+    return enforcement_tool.validate_and_write(
+        generated_markdown=VALID_MARKDOWN,
+        template_name="lean_baseline",
+        output_path=OUTPUT_PATH,
+        file_metadata=file_metadata,
+        config=basic_config,
+        template_content=minimal_template,
+        dry_run=True
+    )
 
-# Service Documentation
 
-## Overview
-Service description.
+_WINDOWS_SYMLINK_SKIP = pytest.mark.skip(
+    reason="Windows symlink traversal detection in temp directory - platform-specific issue"
+)
+
+
+def _assert_valid_document_written(result: EnforceResult, full_path: Path) -> None:
+    """Valid markdown with YAML (sections in template order) should pass validation and write."""
+    assert result.valid is True
+    assert result.file_path is not None
+    assert len(result.write_errors) == 0
+    assert full_path.exists()
+
+    # Verify file content
+    assert "enrollment" in result.written_content
+    assert "Overview" in result.written_content
+
+
+def _assert_yaml_generated(result: EnforceResult, full_path: Path) -> None:
+    """Markdown without YAML should auto-generate YAML and pass."""
+    assert result.valid is True
+    assert full_path.exists()
+
+    # Verify written file has YAML
+    assert result.written_content.startswith("---")
+    assert "lastUpdated:" in result.written_content
+
+
+def _assert_events_logged(result: EnforceResult, full_path: Path) -> None:
+    """Logging should capture schema, validation, and write events."""
+    # Should have schema built, validation run, write attempt, and write success
+    assert len(result.events) >= 3
+    event_types = [e.event_type for e in result.events]
+    assert "SCHEMA_BUILT" in event_types
+    assert "VALIDATION_RUN" in event_types
+    assert "WRITE_ATTEMPT" in event_types or "WRITE_SUCCESS" in event_types
+
+    # The logged write really happened and written_content is what landed on disk
+    assert full_path.exists()
+    assert result.written_content == full_path.read_text(encoding="utf-8")
+    assert "enrollment" in result.written_content
+
+
+VALID_DOCUMENT_SCENARIOS = [
+    pytest.param(VALID_MARKDOWN, _assert_valid_document_written,
+                 id="valid_document_writes", marks=_WINDOWS_SYMLINK_SKIP),
+    pytest.param(MARKDOWN_NO_YAML, _assert_yaml_generated,
+                 id="missing_yaml_generated", marks=_WINDOWS_SYMLINK_SKIP),
+    pytest.param(VALID_MARKDOWN, _assert_events_logged, id="logging"),
+]
+
+
+@pytest.mark.parametrize("markdown, check", VALID_DOCUMENT_SCENARIOS)
+def test_valid_document_scenarios(
+    enforcement_tool,
+    minimal_template,
+    file_metadata,
+    tmp_path,
+    output_md,
+    markdown,
+    check
+):
+    """Run validate_and_write once per write scenario and check the result bundle."""
+    # Fresh workspace per scenario so each write starts from an empty docs/
+    result = enforcement_tool.validate_and_write(
+        generated_markdown=markdown,
+        template_name="lean_baseline",
+        output_path=OUTPUT_PATH,
+        file_metadata=file_metadata,
+        config=_workspace_config(str(tmp_path)),
+        template_content=minimal_template,
+        dry_run=False
+    )
 
-## Architecture
-How it works.
+    check(result, output_md)
+
+
+def test_dry_run_validates_but_no_write(
+    enforcement_tool,
+    minimal_template,
+    file_metadata,
+    tmp_path,
+    output_md
+):
+    """Dry-run should validate but not write file."""
+    # Own workspace, so a write by another test can't decide the "no file" check
+    result = enforcement_tool.validate_and_write(
+        generated_markdown=VALID_MARKDOWN,
+        template_name="lean_baseline",
+        output_path=OUTPUT_PATH,
+        file_metadata=file_metadata,
+        config=_workspace_config(str(tmp_path)),
+        template_content=minimal_template,
+        dry_run=True
+    )
 
-## Examples
-Code examples.
-"""
-        output_path = "docs/EnrollmentService.md"
-        
-        # Act
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
+    assert result.valid is True
+    assert result.dry_run is True
+    assert not output_md.exists()  # File should NOT be written
+    assert result.written_content is None
+    assert "Would write" in result.summary
+
+
+def test_perfect_document_has_high_confidence(valid_dry_result):
+    """Perfect document should have confidence close to 1.0."""
+    assert valid_dry_result.confidence >= 0.9
+
+
+# Wall-clock checks flake under -n auto with coverage, so CI runs this in its own
+# "Run timing budget checks" step with TEST_TIMING_BUDGETS set
+@pytest.mark.slow
+@pytest.mark.skipif(not os.getenv("TEST_TIMING_BUDGETS"), reason="Timing budget checks disabled")
+def test_validate_and_write_dry_run_within_budget(
+    enforcement_tool,
+    basic_config,
+    minimal_template,
+    file_metadata
+):
+    """Dry-run validation should stay fast (guards against order-of-magnitude regressions)."""
+    # Median is ~0.09 ms plain and ~0.3 ms under coverage; 5 ms leaves ~18x headroom
+    budget_seconds = 0.005
+    timings = []
+    for _ in range(50):
+        start = time.perf_counter()
+        enforcement_tool.validate_and_write(
+            generated_markdown=VALID_MARKDOWN,
             template_name="lean_baseline",
-            output_path=output_path,
+            output_path=OUTPUT_PATH,
             file_metadata=file_metadata,
             config=basic_config,
             template_content=minimal_template,
             dry_run=True
         )
-        
-        # Assert
-        assert result.confidence >= 0.9
+        timings.append(time.perf_counter() - start)
 
+    assert statistics.median(timings) < budget_seconds
 
-@pytest.mark.skip(reason="Windows symlink traversal detection in temp directory - platform-specific issue")
-class TestHeadingHierarchyValidation:
-    """Test heading level validation."""
-    
-    def test_heading_level_jump_detected(
-        self,
-        enforcement_tool,
-        basic_config,
-        minimal_template,
-        file_metadata
-    ):
-        """Heading level jumps (H1 -> H3) should be detected."""
-        # Arrange - H1 to H3 jump should be invalid
-        markdown = """---
-feature: enrollment
-domain: Services
-layer: API
-component: EnrollmentService
-status: deployed
-version: 1.0
-componentType: Service
-priority: TBD
-lastUpdated: 2026-02-03
----
-
-# Service Documentation
 
-### Overview
-(skipped H2, should be invalid)
+def test_schema_cache_shared_across_tools(minimal_template, monkeypatch):
+    """Separate EnforcementTool instances reuse one parsed schema per (template, checksum)."""
+    first_tool, second_tool = EnforcementTool(), EnforcementTool()
+    assert first_tool.schema_builder is not second_tool.schema_builder
 
-## Architecture
-How it works.
-
-## Examples
-Code examples.
-"""
-        output_path = "docs/EnrollmentService.md"
-        
-        # Act
-        result = enforcement_tool.validate_and_write(
-            generated_markdown=markdown,
-            template_name="lean_baseline",
-            output_path=output_path,
-            file_metadata=file_metadata,
-            config=basic_config,
-            template_content=minimal_template,
-            dry_run=False
-        )
-        
-        # Assert - should fail due to heading hierarchy violation
-        # If this passes, it means hierarchy check isn't catching H1->H3 jumps yet
-        # Phase 1 MVP may not have strict heading hierarchy checking
-        if result.valid is False:
-            assert any("heading" in err.lower() or "level" in err.lower() for err in result.validation_errors)
-        # If it passes, that's OK for Phase 1 MVP - focus on critical rules first
+    first = first_tool.schema_builder.build_schema("lean_baseline", minimal_template)
+    # A second build must come from the shared cache, not from parsing again
+    monkeypatch.setattr(
+        second_tool.schema_builder, "extract_heading_hierarchy",
+        lambda content: pytest.fail("schema was rebuilt")
+    )
+    second = second_tool.schema_builder.build_schema("lean_baseline", minimal_template)
+
+    assert second == first
+    # Each builder gets its own copy, so mutations don't leak between tools
+    second.heading_rules["Injected"] = 2
+    assert "Injected" not in first.heading_rules
+
+
+@pytest.mark.skip(reason="Template name mapping issue - 'lean_baseline' vs 'lean_baseline_service_template.md'")
+def test_missing_required_section_fails(
+    enforcement_tool,
+    basic_config,
+    minimal_template,
+    file_metadata
+):
+    """Markdown missing required section should fail."""
+    # Arrange - template requires: Overview, Architecture, Examples
+    # Markdown missing: Examples
+    markdown = MARKDOWN_MISSING_EXAMPLES
+    output_path = OUTPUT_PATH
+    
+    # Act
+    result = enforcement_tool.validate_and_write(
+        generated_markdown=markdown,
+        template_name="lean_baseline",
+        output_path=output_path,
+        file_metadata=file_metadata,
+        config=basic_config,
+        template_content=minimal_template,
+        dry_run=False
+    )
+    
+    # Assert
+    assert result.valid is False
+    assert len(result.validation_errors) > 0
+    assert any("section" in err.lower() for err in result.validation_errors)
+
+
+def test_invalid_path_outside_workspace_fails(
+    enforcement_tool,
+    basic_config,
+    minimal_template,
+    file_metadata,
+    temp_workspace
+):
+    """Output path outside workspace should fail."""
+    # Arrange
+    markdown = VALID_MARKDOWN
+    # Try to write outside workspace
+    output_path = "../../../etc/passwd.md"
+    
+    # Act
+    result = enforcement_tool.validate_and_write(
+        generated_markdown=markdown,
+        template_name="lean_baseline",
+        output_path=output_path,
+        file_metadata=file_metadata,
+        config=basic_config,
+        template_content=minimal_template,
+        dry_run=False
+    )
+    
+    # Assert
+    assert result.valid is False
+    assert len(result.write_errors) > 0
+    assert any("parent" in err.lower() or "outside" in err.lower() for err in result.write_errors)
+
+
+def test_invalid_path_no_md_extension_fails(
+    enforcement_tool,
+    basic_config,
+    minimal_template,
+    file_metadata
+):
+    """Output path without .md extension should fail."""
+    # Arrange
+    markdown = VALID_MARKDOWN
+    output_path = "docs/EnrollmentService.txt"
+    
+    # Act
+    result = enforcement_tool.validate_and_write(
+        generated_markdown=markdown,
+        template_name="lean_baseline",
+        output_path=output_path,
+        file_metadata=file_metadata,
+        config=basic_config,
+        template_content=minimal_template,
+        dry_run=False
+    )
+    
+    # Assert
+    assert result.valid is False
+    assert len(result.write_errors) > 0
+    assert any(".md" in err.lower() for err in result.write_errors)
+
+
+@_WINDOWS_SYMLINK_SKIP
+def test_heading_level_jump_detected(
+    enforcement_tool,
+    basic_config,
+    minimal_template,
+    file_metadata
+):
+    """Heading level jumps (H1 -> H3) should be detected."""
+    # Arrange - H1 to H3 jump should be invalid
+    markdown = MARKDOWN_BAD_HEADING
+    output_path = OUTPUT_PATH
+    
+    # Act - validation runs before (and independently of) the write path, so skip the write
+    result = enforcement_tool.validate_and_write(
+        generated_markdown=markdown,
+        template_name="lean_baseline",
+        output_path=output_path,
+        file_metadata=file_metadata,
+        config=basic_config,
+        template_content=minimal_template,
+        dry_run=True
+    )
+    
+    # Assert - should fail due to heading hierarchy violation
+    # If this passes, it means hierarchy check isn't catching H1->H3 jumps yet
+    # Phase 1 MVP may not have strict heading hierarchy checking
+    if result.valid is False:
+        assert any("heading" in err.lower() or "level" in err.lower() for err in result.validation_errors)
+    # If it passes, that's OK for Phase 1 MVP - focus on critical rules first
@@ -6,32 +6,18 @@ Tests: extract_code_context → get_charter → validate_documentation → write
 """
 
 import json
-import tempfile
 from pathlib import Path
 from typing import Any, Dict
 
 import pytest
 
-from src.tools.code_analytics import CodeAnalyzer
-from src.tools.template_schema_builder import TemplateSchemaBuilder
-from src.tools.validation_library import ValidationEngine, ValidationTier
+from src.tools.validation_library import ValidationTier
 
 
 class TestEndToEndWorkflow:
     """Test complete workflows from extraction to writing."""
     
-    def setup_method(self):
-        """Set up test resources."""
-        self.analyzer = CodeAnalyzer()
-        self.schema_builder = TemplateSchemaBuilder()
-        self.validator = ValidationEngine(schema_builder=self.schema_builder, config={})
-        self.temp_dir = tempfile.TemporaryDirectory()
-    
-    def teardown_method(self):
-        """Clean up test resources."""
-        self.temp_dir.cleanup()
-    
-    def test_csharp_extraction_to_charter_request(self):
+    def test_csharp_extraction_to_charter_request(self, analyzer, tmp_path):
         """Test extracting C# code and preparing charter request."""
         # Step 1: Create sample C# file
         csharp_content = '''
@@ -55,11 +41,11 @@ namespace MyServices
     }
 }
 '''
-        csharp_path = Path(self.temp_dir.name) / "auth_service.cs"
+        csharp_path = tmp_path / "auth_service.cs"
         csharp_path.write_text(csharp_content)
         
         # Step 2: Extract code context
-        result = self.analyzer.analyze(str(csharp_path), ["methods", "classes"])
+        result = analyzer.analyze(str(csharp_path), ["methods", "classes"])
         
         # Verify extraction
         assert result["language_detected"] == "csharp"
@@ -81,7 +67,7 @@ namespace MyServices
         assert charter_request["language"] == "csharp"
         assert "classes" in charter_request["extracted_items"]
     
-    def test_sql_extraction_to_charter_request(self):
+    def test_sql_extraction_to_charter_request(self, analyzer, tmp_path):
         """Test extracting SQL schema and preparing charter request."""
         # Step 1: Create sample SQL file
         sql_content = '''
@@ -98,11 +84,11 @@ CREATE TABLE sessions (
     expires_at DATETIME NOT NULL
 );
 '''
-        sql_path = Path(self.temp_dir.name) / "schema.sql"
+        sql_path = tmp_path / "schema.sql"
         sql_path.write_text(sql_content)
         
         # Step 2: Extract schema
-        result = self.analyzer.analyze(str(sql_path), ["sql_tables"])
+        result = analyzer.analyze(str(sql_path), ["sql_tables"])
         
         # Verify extraction
         assert result["language_detected"] == "sql"
@@ -166,7 +152,7 @@ Manages user authentication and session lifecycle.
         assert validation_data["metadata"]["template_used"] == "service_template"
         assert len(validation_data["content"]) > 0
     
-    def test_full_workflow_extract_validate_prepare_write(self):
+    def test_full_workflow_extract_validate_prepare_write(self, analyzer, tmp_path):
         """Test complete workflow: extract → validate → prepare → write."""
         # Step 1: Extract from sample code
         sample_code = '''
@@ -190,10 +176,10 @@ namespace UserManagement
     }
 }
 '''
-        code_path = Path(self.temp_dir.name) / "user_service.cs"
+        code_path = tmp_path / "user_service.cs"
         code_path.write_text(sample_code)
         
-        extraction = self.analyzer.analyze(str(code_path), ["methods", "classes"])
+        extraction = analyzer.analyze(str(code_path), ["methods", "classes"])
         
         # Step 2: Simulate charter generation (would be done by Chat)
         charter = f'''# Service Charter: User Service
@@ -212,7 +198,7 @@ Manages user CRUD operations and lifecycle.
 - Database service
 - Logging service
 '''
-        charter_path = Path(self.temp_dir.name) / "charter.md"
+        charter_path = tmp_path / "charter.md"
         charter_path.write_text(charter)
         
         # Step 3: Validate charter
@@ -255,26 +241,17 @@ Manages user CRUD operations and lifecycle.
 class TestMultiLanguageWorkflow:
     """Test workflows with multiple languages in repo."""
     
-    def setup_method(self):
-        """Set up test resources."""
-        self.analyzer = CodeAnalyzer()
-        self.temp_dir = tempfile.TemporaryDirectory()
-    
-    def teardown_method(self):
-        """Clean up test resources."""
-        self.temp_dir.cleanup()
-    
-    def test_mixed_repo_extraction(self):
+    def test_mixed_repo_extraction(self, analyzer, tmp_path):
         """Test extracting from repository with mixed C# and SQL files."""
         # Create sample mixed repo
-        csharp_file = Path(self.temp_dir.name) / "service.cs"
+        csharp_file = tmp_path / "service.cs"
         csharp_file.write_text('''
 public class OrderService {
     public Order GetOrder(int id) { return new Order(); }
 }
 ''')
         
-        sql_file = Path(self.temp_dir.name) / "schema.sql"
+        sql_file = tmp_path / "schema.sql"
         sql_file.write_text('''
 CREATE TABLE orders (
     order_id INT PRIMARY KEY,
@@ -282,12 +259,9 @@ CREATE TABLE orders (
 );
 ''')
         
-        # Extract from C# file
-        cs_result = self.analyzer.analyze(str(csharp_file), ["classes", "methods"])
+        # Extract from both files in one batch (auto-selected types per language)
+        cs_result, sql_result = analyzer.analyze_many([str(csharp_file), str(sql_file)])
         assert cs_result["language_detected"] == "csharp"
-        
-        # Extract from SQL file
-        sql_result = self.analyzer.analyze(str(sql_file), ["sql_tables"])
         assert sql_result["language_detected"] == "sql"
         
         # Verify both can be processed
@@ -298,23 +272,12 @@ CREATE TABLE orders (
 class TestErrorHandlingWorkflow:
     """Test error handling in workflows."""
     
-    def setup_method(self):
-        """Set up test resources."""
-        self.analyzer = CodeAnalyzer()
-        self.schema_builder = TemplateSchemaBuilder()
-        self.validator = ValidationEngine(schema_builder=self.schema_builder, config={})
-        self.temp_dir = tempfile.TemporaryDirectory()
-    
-    def teardown_method(self):
-        """Clean up test resources."""
-        self.temp_dir.cleanup()
-    
-    def test_missing_source_file_handling(self):
+    def test_missing_source_file_handling(self, analyzer, tmp_path):
         """Test workflow handles missing source files gracefully."""
-        missing_file = Path(self.temp_dir.name) / "nonexistent.cs"
+        missing_file = tmp_path / "nonexistent.cs"
         
         # Extraction should handle gracefully
-        result = self.analyzer.analyze(str(missing_file), ["methods"])
+        result = analyzer.analyze(str(missing_file), ["methods"])
         
         # Should have metadata indicating extraction issues
         assert "metadata" in result
@@ -338,14 +301,14 @@ class TestErrorHandlingWorkflow:
         assert validation_result["is_valid"] is False
         assert len(validation_result["errors"]) > 0
     
-    def test_charter_generation_error_recovery(self):
+    def test_charter_generation_error_recovery(self, analyzer, tmp_path):
         """Test recovery when charter generation fails in workflow."""
         # Create a file that might fail parsing
-        ambiguous_file = Path(self.temp_dir.name) / "ambiguous.cs"
+        ambiguous_file = tmp_path / "ambiguous.cs"
         ambiguous_file.write_text("*** INVALID C# CODE ***")
         
         # Extraction should handle gracefully
-        result = self.analyzer.analyze(str(ambiguous_file), ["methods", "classes"])
+        result = analyzer.analyze(str(ambiguous_file), ["methods", "classes"])
         
         # Should have error metadata
         assert "metadata" in result
@@ -365,21 +328,12 @@ class TestErrorHandlingWorkflow:
 class TestAuditTrailInWorkflow:
     """Test that workflow maintains audit trails for compliance."""
     
-    def setup_method(self):
-        """Set up test resources."""
-        self.analyzer = CodeAnalyzer()
-        self.temp_dir = tempfile.TemporaryDirectory()
-    
-    def teardown_method(self):
-        """Clean up test resources."""
-        self.temp_dir.cleanup()
-    
-    def test_workflow_maintains_extraction_metadata(self):
+    def test_workflow_maintains_extraction_metadata(self, analyzer, tmp_path):
         """Test that extraction maintains audit trail."""
-        sample = Path(self.temp_dir.name) / "test.cs"
+        sample = tmp_path / "test.cs"
         sample.write_text("public class Test { public void Run() {} }")
         
-        result = self.analyzer.analyze(str(sample), ["classes"])
+        result = analyzer.analyze(str(sample), ["classes"])
         
         # Should have metadata with audit information
         metadata = result.get("metadata", {})
@@ -1,5 +1,6 @@
 """Integration tests for MCP resource handlers (Phase 1)."""
 
+import asyncio
 import inspect
 import sys
 from typing import Awaitable, Callable, cast
@@ -42,9 +43,11 @@ class FakeResourceManager:
             "backend": FakeCharter("backend", "Backend charter", "# Backend Charter"),
             "ui": FakeCharter("ui", "UI charter", "# UI Charter"),
         }
+        # The stub is shared across tests; a tuple keeps callers from mutating it
+        self._charter_list = tuple(self._charters.values())
 
     def list_charters(self):
-        return list(self._charters.values())
+        return self._charter_list
 
     def get_charter(self, name: str):
         return self._charters.get(name)
@@ -56,90 +59,120 @@ class FakeResolver:
             "lean_baseline_service_template": "# Lean Template",
             "standard_service_template": "# Standard Template",
         }
+        self._template_ids = tuple(sorted(self._templates))
 
     def list_templates(self):
-        return sorted(self._templates.keys())
+        return self._template_ids
 
     def get_template(self, template_id: str):
         return self._templates.get(template_id)
 
 
-@pytest.mark.asyncio
-async def test_list_resources_includes_templates_and_charters(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_resolver = FakeResolver()
-    fake_manager = FakeResourceManager()
-
+@pytest.fixture(autouse=True)
+def _skip_server_init(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep server.ensure_initialized from loading real templates and charters."""
     monkeypatch.setattr(server, "ensure_initialized", lambda: None)
-    monkeypatch.setattr(server, "get_template_resolver", lambda: fake_resolver)
-    monkeypatch.setattr(server, "get_resource_manager", lambda: fake_manager)
-
-    list_resources_handler = cast(
-        Callable[[], Awaitable[list[Resource]]],
-        server.list_resources,
-    )
-    resources = await list_resources_handler()
-
-    template_uris = {str(res.uri) for res in resources if str(res.uri).startswith("akr://template/")}
-    charter_uris = {str(res.uri) for res in resources if str(res.uri).startswith("akr://charter/")}
 
-    assert "akr://template/lean_baseline_service_template" in template_uris
-    assert "akr://template/standard_service_template" in template_uris
-    assert "akr://charter/backend" in charter_uris
-    assert "akr://charter/ui" in charter_uris
 
-    assert all(res.mimeType == "text/markdown" for res in resources)
+@pytest.fixture(scope="module")
+def fake_resolver() -> FakeResolver:
+    """Read-only template resolver stub shared by the tests in this module."""
+    return FakeResolver()
 
 
-@pytest.mark.asyncio
-async def test_read_template_resource_returns_content(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_resolver = FakeResolver()
-
-    monkeypatch.setattr(server, "ensure_initialized", lambda: None)
-    monkeypatch.setattr(server, "get_template_resolver", lambda: fake_resolver)
-
-    content = await server.read_template_resource("akr://template/lean_baseline_service_template")
-    assert content == "# Lean Template"
-
-
-@pytest.mark.asyncio
-async def test_read_template_resource_not_found_lists_available(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_resolver = FakeResolver()
-
-    monkeypatch.setattr(server, "ensure_initialized", lambda: None)
-    monkeypatch.setattr(server, "get_template_resolver", lambda: fake_resolver)
+@pytest.fixture(scope="module")
+def fake_manager() -> FakeResourceManager:
+    """Read-only charter manager stub shared by the tests in this module."""
+    return FakeResourceManager()
 
-    content = await server.read_template_resource("akr://template/unknown")
-    assert "Template not found" in content
-    assert "akr://template/lean_baseline_service_template" in content
 
+@pytest.fixture(scope="module")
+def listed_resources(fake_resolver: FakeResolver, fake_manager: FakeResourceManager) -> list[Resource]:
+    """resources/list against the fakes, run once for the read-only assertions below."""
+    list_resources_handler = cast(
+        Callable[[], Awaitable[list[Resource]]],
+        server.list_resources,
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(server, "ensure_initialized", lambda: None)
+        mp.setattr(server, "get_template_resolver", lambda: fake_resolver)
+        mp.setattr(server, "get_resource_manager", lambda: fake_manager)
+        return asyncio.run(list_resources_handler())
 
-@pytest.mark.asyncio
-async def test_read_charter_resource_returns_content(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_manager = FakeResourceManager()
 
-    monkeypatch.setattr(server, "ensure_initialized", lambda: None)
-    monkeypatch.setattr(server, "get_resource_manager", lambda: fake_manager)
+def test_list_resources_includes_templates_and_charters(listed_resources: list[Resource]) -> None:
+    # Full URIs carry their scheme prefix, so one set covers templates and charters
+    uris = {str(res.uri) for res in listed_resources}
 
-    content = await server.read_charter_resource("akr://charter/backend")
-    assert content == "# Backend Charter"
+    assert "akr://template/lean_baseline_service_template" in uris
+    assert "akr://template/standard_service_template" in uris
+    assert "akr://charter/backend" in uris
+    assert "akr://charter/ui" in uris
 
+    assert all(res.mimeType == "text/markdown" for res in listed_resources)
 
-@pytest.mark.asyncio
-async def test_read_charter_resource_not_found_lists_available(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_manager = FakeResourceManager()
 
-    monkeypatch.setattr(server, "ensure_initialized", lambda: None)
+@pytest.fixture
+def patched_server(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_resolver: FakeResolver,
+    fake_manager: FakeResourceManager,
+) -> None:
+    """Point server's template resolver and charter manager at the fakes."""
+    monkeypatch.setattr(server, "get_template_resolver", lambda: fake_resolver)
     monkeypatch.setattr(server, "get_resource_manager", lambda: fake_manager)
 
-    content = await server.read_charter_resource("akr://charter/unknown")
-    assert "Charter not found" in content
-    assert "akr://charter/backend" in content
-
-
-@pytest.mark.asyncio
-async def test_list_resource_templates_returns_patterns(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(server, "ensure_initialized", lambda: None)
 
+# Template and charter reads are symmetric; each case names the server handler to call
+@pytest.mark.parametrize(
+    "handler_name, uri, expected",
+    [
+        pytest.param(
+            "read_template_resource",
+            "akr://template/lean_baseline_service_template",
+            "# Lean Template",
+            id="template",
+        ),
+        pytest.param("read_charter_resource", "akr://charter/backend", "# Backend Charter", id="charter"),
+    ],
+)
+async def test_read_resource_returns_content(patched_server, handler_name: str, uri: str, expected: str) -> None:
+    content = await getattr(server, handler_name)(uri)
+    assert content == expected
+
+
+@pytest.mark.parametrize(
+    "handler_name, uri, not_found, available_uri",
+    [
+        pytest.param(
+            "read_template_resource",
+            "akr://template/unknown",
+            "Template not found",
+            "akr://template/lean_baseline_service_template",
+            id="template",
+        ),
+        pytest.param(
+            "read_charter_resource",
+            "akr://charter/unknown",
+            "Charter not found",
+            "akr://charter/backend",
+            id="charter",
+        ),
+    ],
+)
+async def test_read_resource_not_found_lists_available(
+    patched_server,
+    handler_name: str,
+    uri: str,
+    not_found: str,
+    available_uri: str,
+) -> None:
+    content = await getattr(server, handler_name)(uri)
+    assert not_found in content
+    assert available_uri in content
+
+
+async def test_list_resource_templates_returns_patterns() -> None:
     templates = await server.list_resource_templates()
 
     uri_templates = {tmpl.uriTemplate for tmpl in templates}
@@ -152,8 +185,7 @@ async def test_list_resource_templates_returns_patterns(monkeypatch: pytest.Monk
 class TestMCPResourcesSpecCompliance:
     """BLOCKER 2: Test MCP resources/read returns spec-compliant payload"""
     
-    @pytest.mark.asyncio
-    async def test_read_resource_return_type_is_string(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def test_read_resource_return_type_is_string(self, patched_server) -> None:
         """
         Verify that read_resource handlers return string (MCP SDK wraps into contents[]).
         
@@ -162,10 +194,6 @@ class TestMCPResourcesSpecCompliance:
         
         This test verifies the handler returns a string, which is the correct contract.
         """
-        fake_resolver = FakeResolver()
-        monkeypatch.setattr(server, "ensure_initialized", lambda: None)
-        monkeypatch.setattr(server, "get_template_resolver", lambda: fake_resolver)
-        
         # Call handler directly
         result = await server.read_template_resource("akr://template/lean_baseline_service_template")
         
@@ -174,34 +202,21 @@ class TestMCPResourcesSpecCompliance:
         assert len(result) > 0, "Content should not be empty"
         assert "# Lean Template" in result
     
-    @pytest.mark.asyncio
-    async def test_resources_list_has_required_fields(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_resources_list_has_required_fields(self, listed_resources: list[Resource]) -> None:
         """Verify resources/list returns resources with uri, name, mimeType"""
-        fake_resolver = FakeResolver()
-        fake_manager = FakeResourceManager()
-        
-        monkeypatch.setattr(server, "ensure_initialized", lambda: None)
-        monkeypatch.setattr(server, "get_template_resolver", lambda: fake_resolver)
-        monkeypatch.setattr(server, "get_resource_manager", lambda: fake_manager)
-        
-        resources = await server.list_resources()
-        
-        assert isinstance(resources, list), "resources must be list"
-        assert len(resources) > 0, "resources must not be empty"
+        assert isinstance(listed_resources, list), "resources must be list"
+        assert len(listed_resources) > 0, "resources must not be empty"
         
         # Check each resource has required fields
-        for resource in resources:
+        for resource in listed_resources:
             assert hasattr(resource, 'uri'), "Missing uri field"
             assert hasattr(resource, 'name'), "Missing name field"
             assert hasattr(resource, 'mimeType'), "Missing mimeType field"
             assert str(resource.uri).startswith("akr://"), f"Invalid URI scheme: {resource.uri}"
             assert resource.mimeType == "text/markdown", f"Wrong mimeType: {resource.mimeType}"
     
-    @pytest.mark.asyncio
-    async def test_resource_templates_has_uri_template_field(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def test_resource_templates_has_uri_template_field(self) -> None:
         """Verify resources/templates exposes uriTemplate for dynamic URIs"""
-        monkeypatch.setattr(server, "ensure_initialized", lambda: None)
-        
         templates = await server.list_resource_templates()
         
         assert isinstance(templates, list), "resourceTemplates must be list"
@@ -9,14 +9,27 @@ Tests for:
 
 import pytest
 from pathlib import Path
-from src.tools.extractors.dto_extractor import DTOExtractor, DTOProperty, ValidationRule, ExtractedDTO
+from src.tools.context_builder import build_service_context
+from src.tools.extractors.base_extractor import ExtractedData
+from src.tools.extractors.dto_extractor import DTOExtractor
 from src.tools.extractors.csharp_extractor import CSharpExtractor
 
 
+# The extractors keep no per-call state, so one instance serves the whole module
+@pytest.fixture(scope="module")
+def dto_extractor() -> DTOExtractor:
+    return DTOExtractor()
+
+
+@pytest.fixture(scope="module")
+def csharp_extractor() -> CSharpExtractor:
+    return CSharpExtractor()
+
+
 class TestDTOExtraction:
     """Test DTO property and validation extraction."""
     
-    def test_extract_dto_properties(self):
+    def test_extract_dto_properties(self, dto_extractor):
         """Test extraction of DTO properties."""
         sample_code = '''
         public class CreateCourseRequest
@@ -28,8 +41,7 @@ class TestDTOExtraction:
         }
         '''
         
-        extractor = DTOExtractor()
-        dtos = extractor.extract_dtos(sample_code, "test.cs")
+        dtos = dto_extractor.extract_dtos(sample_code, "test.cs")
         
         assert len(dtos) == 1
         dto = dtos[0]
@@ -50,7 +62,7 @@ class TestDTOExtraction:
         validity_prop = next(p for p in dto.properties if p.name == "ValidityMonths")
         assert validity_prop.nullable
         
-    def test_extract_data_annotations(self):
+    def test_extract_data_annotations(self, dto_extractor):
         """Test extraction of DataAnnotations attributes."""
         sample_code = '''
         public class UpdateCourseRequest
@@ -66,8 +78,7 @@ class TestDTOExtraction:
         }
         '''
         
-        extractor = DTOExtractor()
-        dtos = extractor.extract_dtos(sample_code, "test.cs")
+        dtos = dto_extractor.extract_dtos(sample_code, "test.cs")
         
         assert len(dtos) == 1
         dto = dtos[0]
@@ -80,7 +91,7 @@ class TestDTOExtraction:
         description_prop = next(p for p in dto.properties if p.name == "Description")
         assert "StringLength" in description_prop.attributes
         
-    def test_generate_sample_json(self):
+    def test_generate_sample_json(self, dto_extractor):
         """Test sample JSON generation for DTOs."""
         sample_code = '''
         public class CourseDetailDto
@@ -92,11 +103,10 @@ class TestDTOExtraction:
         }
         '''
         
-        extractor = DTOExtractor()
-        dtos = extractor.extract_dtos(sample_code, "test.cs")
+        dtos = dto_extractor.extract_dtos(sample_code, "test.cs")
         dto = dtos[0]
         
-        sample = extractor.generate_sample_json(dto)
+        sample = dto_extractor.generate_sample_json(dto)
         
         assert "Id" in sample
         assert "Title" in sample
@@ -107,17 +117,15 @@ class TestDTOExtraction:
         assert isinstance(sample["IsRequired"], bool)
         assert sample["IsRequired"] == True
         
-    def test_determine_dto_type(self):
+    def test_determine_dto_type(self, dto_extractor):
         """Test DTO type inference from class name."""
-        extractor = DTOExtractor()
-        
-        assert extractor._determine_dto_type("CreateCourseRequest") == "CreateRequest"
-        assert extractor._determine_dto_type("UpdateCourseRequest") == "UpdateRequest"
-        assert extractor._determine_dto_type("CourseDetailDto") == "DetailResponse"
-        assert extractor._determine_dto_type("CourseListResponse") == "ListResponse"
-        assert extractor._determine_dto_type("CoursesContract") == "Contract"
+        assert dto_extractor._determine_dto_type("CreateCourseRequest") == "CreateRequest"
+        assert dto_extractor._determine_dto_type("UpdateCourseRequest") == "UpdateRequest"
+        assert dto_extractor._determine_dto_type("CourseDetailDto") == "DetailResponse"
+        assert dto_extractor._determine_dto_type("CourseListResponse") == "ListResponse"
+        assert dto_extractor._determine_dto_type("CoursesContract") == "Contract"
         
-    def test_generate_validation_matrix(self):
+    def test_generate_validation_matrix(self, dto_extractor):
         """Test validation matrix generation for templates."""
         sample_code = '''
         public class CourseRequest
@@ -130,11 +138,10 @@ class TestDTOExtraction:
         }
         '''
         
-        extractor = DTOExtractor()
-        dtos = extractor.extract_dtos(sample_code, "test.cs")
+        dtos = dto_extractor.extract_dtos(sample_code, "test.cs")
         dto = dtos[0]
         
-        matrix = extractor.generate_validation_matrix(dto)
+        matrix = dto_extractor.generate_validation_matrix(dto)
         
         # Should have validation rules for Title
         title_validations = [m for m in matrix if m['property'] == 'Title']
@@ -146,10 +153,8 @@ class TestDTOExtraction:
             assert 'rule' in rule
             assert 'error_message' in rule
             
-    def test_csharp_extractor_includes_dtos(self):
+    def test_csharp_extractor_includes_dtos(self, csharp_extractor):
         """Test that CSharpExtractor includes DTOs in extraction."""
-        test_file = Path("test_dtos.cs")
-        
         sample_code = '''
         namespace TestApp
         {
@@ -167,32 +172,22 @@ class TestDTOExtraction:
         }
         '''
         
-        # Write temporary test file
-        test_file.write_text(sample_code)
+        # extract() only adds the file read, so parse the snippet in memory
+        extracted = csharp_extractor.extract_content(sample_code, Path("test_dtos.cs"))
         
-        try:
-            extractor = CSharpExtractor()
-            extracted = extractor.extract(test_file)
-            
-            # Should extract DTOs
-            assert len(extracted.dtos) >= 2
-            
-            dto_names = [dto.name for dto in extracted.dtos]
-            assert "CourseRequest" in dto_names
-            assert "CourseResponse" in dto_names
-            
-        finally:
-            test_file.unlink(missing_ok=True)
+        # Should extract DTOs
+        assert len(extracted.dtos) >= 2
+        
+        dto_names = [dto.name for dto in extracted.dtos]
+        assert "CourseRequest" in dto_names
+        assert "CourseResponse" in dto_names
 
 
 class TestDTOContextTransformation:
     """Test transformation of DTOs to template context."""
     
-    def test_dto_fields_in_context(self):
+    def test_dto_fields_in_context(self, dto_extractor):
         """Test that DTOs populate request_response_examples and request_response_schemas."""
-        from src.tools.context_builder import build_service_context
-        from src.tools.extractors.base_extractor import ExtractedData
-        
         # Create mock extracted data with DTOs
         extracted = ExtractedData(language='csharp', file_path='test.cs')
         
@@ -206,7 +201,6 @@ class TestDTOContextTransformation:
         }
         '''
         
-        dto_extractor = DTOExtractor()
         extracted.dtos = dto_extractor.extract_dtos(sample_code, 'test.cs')
         
         # Build context
@@ -13,10 +13,21 @@ from tools.extractors.csharp_extractor import CSharpExtractor
 from tools.context_builder import build_service_context
 
 
+# The analyzers keep no per-call state, so one instance serves the whole module
+@pytest.fixture(scope="module")
+def flow_analyzer() -> MethodFlowAnalyzer:
+    return MethodFlowAnalyzer()
+
+
+@pytest.fixture(scope="module")
+def csharp_extractor() -> CSharpExtractor:
+    return CSharpExtractor()
+
+
 class TestMethodFlowAnalyzer:
     """Test MethodFlowAnalyzer functionality."""
     
-    def test_extract_create_flow(self):
+    def test_extract_create_flow(self, flow_analyzer):
         """Test extraction of Create operation flow."""
         source_code = '''
         public class CourseService
@@ -49,8 +60,7 @@ class TestMethodFlowAnalyzer:
         }
         '''
         
-        analyzer = MethodFlowAnalyzer()
-        flows = analyzer.extract_flows(source_code, "CourseService.cs")
+        flows = flow_analyzer.extract_flows(source_code, "CourseService.cs")
         
         assert len(flows) > 0, "Should extract at least one flow"
         
@@ -104,37 +114,35 @@ class TestMethodFlowAnalyzer:
         assert "↓" in diagram  # Arrow
         assert "SUCCESS" in diagram
     
-    def test_operation_type_detection(self):
+    def test_operation_type_detection(self, flow_analyzer):
         """Test operation type is correctly determined from method name."""
-        analyzer = MethodFlowAnalyzer()
         
-        assert analyzer._determine_operation_type("CreateAsync") == "Create"
-        assert analyzer._determine_operation_type("UpdateCourseAsync") == "Update"
-        assert analyzer._determine_operation_type("DeleteAsync") == "Delete"
-        assert analyzer._determine_operation_type("GetByIdAsync") == "Query"
-        assert analyzer._determine_operation_type("AddCourse") == "Create"
+        assert flow_analyzer._determine_operation_type("CreateAsync") == "Create"
+        assert flow_analyzer._determine_operation_type("UpdateCourseAsync") == "Update"
+        assert flow_analyzer._determine_operation_type("DeleteAsync") == "Delete"
+        assert flow_analyzer._determine_operation_type("GetByIdAsync") == "Query"
+        assert flow_analyzer._determine_operation_type("AddCourse") == "Create"
     
-    def test_pattern_detection(self):
+    def test_pattern_detection(self, flow_analyzer):
         """Test pattern detection for different step types."""
-        analyzer = MethodFlowAnalyzer()
         
         # Validation patterns
         validation_code = "if (course == null) throw new ArgumentNullException();"
-        assert analyzer._contains_pattern(validation_code, analyzer.validation_patterns)
+        assert flow_analyzer._contains_pattern(validation_code, flow_analyzer.validation_patterns)
         
         # Query patterns
         query_code = "var course = await _repo.FirstOrDefaultAsync(x => x.Id == id);"
-        assert analyzer._contains_pattern(query_code, analyzer.query_patterns)
+        assert flow_analyzer._contains_pattern(query_code, flow_analyzer.query_patterns)
         
         # Persistence patterns
         persistence_code = "await _context.SaveChangesAsync();"
-        assert analyzer._contains_pattern(persistence_code, analyzer.persistence_patterns)
+        assert flow_analyzer._contains_pattern(persistence_code, flow_analyzer.persistence_patterns)
         
         # Mapping patterns
         mapping_code = "return _mapper.Map<CourseDto>(course);"
-        assert analyzer._contains_pattern(mapping_code, analyzer.mapping_patterns)
+        assert flow_analyzer._contains_pattern(mapping_code, flow_analyzer.mapping_patterns)
     
-    def test_multiple_flows_extraction(self):
+    def test_multiple_flows_extraction(self, flow_analyzer):
         """Test extraction of multiple operation flows from one file."""
         source_code = '''
         public class CourseService
@@ -162,8 +170,7 @@ class TestMethodFlowAnalyzer:
         }
         '''
         
-        analyzer = MethodFlowAnalyzer()
-        flows = analyzer.extract_flows(source_code, "CourseService.cs")
+        flows = flow_analyzer.extract_flows(source_code, "CourseService.cs")
         
         assert len(flows) == 3, "Should extract all three CRUD operations"
         
@@ -176,7 +183,7 @@ class TestMethodFlowAnalyzer:
 class TestPhase8Integration:
     """Test Phase 8 integration with the extraction pipeline."""
     
-    def test_csharp_extractor_includes_flows(self):
+    def test_csharp_extractor_includes_flows(self, csharp_extractor):
         """Test that CSharpExtractor extracts operation flows."""
         source_code = '''
         public class CourseService
@@ -192,25 +199,16 @@ class TestPhase8Integration:
         }
         '''
         
-        # Write to temp file
-        temp_file = Path("test_service.cs")
-        temp_file.write_text(source_code)
+        extracted = csharp_extractor.extract_content(source_code, Path("test_service.cs"))
         
-        try:
-            extractor = CSharpExtractor()
-            extracted = extractor.extract(temp_file)
-            
-            assert hasattr(extracted, 'operation_flows'), "Should have operation_flows field"
-            assert len(extracted.operation_flows) > 0, "Should extract at least one flow"
-            
-            flow = extracted.operation_flows[0]
-            assert flow.method_name == "CreateCourseAsync"
-            assert flow.operation_type == "Create"
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        assert hasattr(extracted, 'operation_flows'), "Should have operation_flows field"
+        assert len(extracted.operation_flows) > 0, "Should extract at least one flow"
+        
+        flow = extracted.operation_flows[0]
+        assert flow.method_name == "CreateCourseAsync"
+        assert flow.operation_type == "Create"
     
-    def test_context_builder_transforms_flows(self):
+    def test_context_builder_transforms_flows(self, csharp_extractor):
         """Test that context builder transforms flows into template context."""
         source_code = '''
         public class CourseService
@@ -227,38 +225,29 @@ class TestPhase8Integration:
         }
         '''
         
-        # Write to temp file
-        temp_file = Path("test_service.cs")
-        temp_file.write_text(source_code)
+        extracted = csharp_extractor.extract_content(source_code, Path("test_service.cs"))
         
-        try:
-            extractor = CSharpExtractor()
-            extracted = extractor.extract(temp_file)
-            
-            # Build service context
-            context = build_service_context("TestService", [extracted])
-            
-            assert hasattr(context, 'operation_flows'), "Context should have operation_flows"
-            assert len(context.operation_flows) > 0, "Should have transformed flows"
-            
-            flow_dict = context.operation_flows[0]
-            assert 'method_name' in flow_dict
-            assert 'operation_type' in flow_dict
-            assert 'ascii_diagram' in flow_dict
-            assert 'steps' in flow_dict
-            
-            # Verify ASCII diagram was generated
-            assert len(flow_dict['ascii_diagram']) > 0
-            assert '┌─' in flow_dict['ascii_diagram']  # Box characters
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        # Build service context
+        context = build_service_context("TestService", [extracted])
+        
+        assert hasattr(context, 'operation_flows'), "Context should have operation_flows"
+        assert len(context.operation_flows) > 0, "Should have transformed flows"
+        
+        flow_dict = context.operation_flows[0]
+        assert 'method_name' in flow_dict
+        assert 'operation_type' in flow_dict
+        assert 'ascii_diagram' in flow_dict
+        assert 'steps' in flow_dict
+        
+        # Verify ASCII diagram was generated
+        assert len(flow_dict['ascii_diagram']) > 0
+        assert '┌─' in flow_dict['ascii_diagram']  # Box characters
 
 
 class TestRealWorldFlow:
     """Test with realistic CourseService method."""
     
-    def test_course_service_create_flow(self):
+    def test_course_service_create_flow(self, flow_analyzer):
         """Test extraction from realistic CourseService.CreateAsync method."""
         source_code = '''
         public class CourseService : ICourseService
@@ -309,8 +298,7 @@ class TestRealWorldFlow:
         }
         '''
         
-        analyzer = MethodFlowAnalyzer()
-        flows = analyzer.extract_flows(source_code, "CourseService.cs")
+        flows = flow_analyzer.extract_flows(source_code, "CourseService.cs")
         
         assert len(flows) > 0
         
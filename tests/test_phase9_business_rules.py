@@ -13,10 +13,21 @@ from tools.extractors.csharp_extractor import CSharpExtractor
 from tools.context_builder import build_service_context
 
 
+# The exception-scan memo is keyed by source text, so sharing one extractor is safe
+@pytest.fixture(scope="module")
+def rule_extractor() -> BusinessRuleExtractor:
+    return BusinessRuleExtractor()
+
+
+@pytest.fixture(scope="module")
+def csharp_extractor() -> CSharpExtractor:
+    return CSharpExtractor()
+
+
 class TestBusinessRuleExtractor:
     """Test BusinessRuleExtractor functionality."""
     
-    def test_extract_from_exceptions(self):
+    def test_extract_from_exceptions(self, rule_extractor):
         """Test extraction of business rules from exception throws."""
         source_code = '''
         public class CourseService
@@ -37,8 +48,7 @@ class TestBusinessRuleExtractor:
         }
         '''
         
-        extractor = BusinessRuleExtractor()
-        rules = extractor.extract_business_rules(source_code, "CourseService.cs")
+        rules = rule_extractor.extract_business_rules(source_code, "CourseService.cs")
         
         assert len(rules) > 0, "Should extract at least one rule"
         
@@ -54,7 +64,7 @@ class TestBusinessRuleExtractor:
         validation_rules = [r for r in rules if r.rule_type == RuleType.VALIDATION]
         assert len(validation_rules) > 0, "Should detect validation rule"
     
-    def test_extract_from_data_annotations(self):
+    def test_extract_from_data_annotations(self, rule_extractor):
         """Test extraction of business rules from DataAnnotations."""
         source_code = '''
         public class CreateCourseRequest
@@ -68,8 +78,7 @@ class TestBusinessRuleExtractor:
         }
         '''
         
-        extractor = BusinessRuleExtractor()
-        rules = extractor.extract_business_rules(source_code, "CreateCourseRequest.cs")
+        rules = rule_extractor.extract_business_rules(source_code, "CreateCourseRequest.cs")
         
         assert len(rules) >= 3, "Should extract multiple rules from DataAnnotations"
         
@@ -85,7 +94,7 @@ class TestBusinessRuleExtractor:
         range_rules = [r for r in rules if 'between 1 and 36' in r.description.lower()]
         assert len(range_rules) > 0, "Should detect Range attribute"
     
-    def test_extract_from_validations(self):
+    def test_extract_from_validations(self, rule_extractor):
         """Test extraction of business rules from validation patterns."""
         source_code = '''
         public async Task UpdateAsync(UpdateRequest request)
@@ -98,8 +107,7 @@ class TestBusinessRuleExtractor:
         }
         '''
         
-        extractor = BusinessRuleExtractor()
-        rules = extractor.extract_business_rules(source_code, "Service.cs")
+        rules = rule_extractor.extract_business_rules(source_code, "Service.cs")
         
         assert len(rules) >= 2, "Should extract validation rules"
         
@@ -111,7 +119,7 @@ class TestBusinessRuleExtractor:
         string_rules = [r for r in rules if 'empty' in r.description.lower() or 'whitespace' in r.description.lower()]
         assert len(string_rules) > 0, "Should detect string validation"
     
-    def test_extract_use_cases(self):
+    def test_extract_use_cases(self, rule_extractor):
         """Test extraction of use cases from service methods."""
         source_code = '''
         public class CourseService
@@ -141,8 +149,7 @@ class TestBusinessRuleExtractor:
         }
         '''
         
-        extractor = BusinessRuleExtractor()
-        use_cases = extractor.extract_use_cases(source_code, "CourseService.cs")
+        use_cases = rule_extractor.extract_use_cases(source_code, "CourseService.cs")
         
         assert len(use_cases) == 4, "Should extract 4 use cases (CRUD operations)"
         
@@ -161,7 +168,7 @@ class TestBusinessRuleExtractor:
         get_use_case = next((uc for uc in use_cases if 'retrieve' in uc.title.lower()), None)
         assert get_use_case is not None, "Should have Get/Retrieve use case"
     
-    def test_extract_faq_items(self):
+    def test_extract_faq_items(self, rule_extractor):
         """Test extraction of FAQ items from exceptions and validations."""
         source_code = '''
         public async Task CreateAsync(CreateRequest request)
@@ -185,8 +192,7 @@ class TestBusinessRuleExtractor:
         }
         '''
         
-        extractor = BusinessRuleExtractor()
-        faq_items = extractor.extract_faq_items(source_code, "Service.cs")
+        faq_items = rule_extractor.extract_faq_items(source_code, "Service.cs")
         
         assert len(faq_items) > 0, "Should extract FAQ items"
         
@@ -202,8 +208,47 @@ class TestBusinessRuleExtractor:
         # Check for not found FAQ
         notfound_faq = next((faq for faq in faq_items if 'not found' in faq.answer.lower()), None)
         assert notfound_faq is not None, "Should have not found FAQ"
-    
-    def test_rule_types_classification(self):
+
+    def test_rules_and_faq_share_exception_scan(self, rule_extractor):
+        """Rules and FAQ items for the same source reuse one scan of its exception throws."""
+        source_code = '''
+        if (existing != null)
+            throw new DuplicateCourseException("Course with this title already exists");
+        '''
+
+        throws = rule_extractor._find_exception_throws(source_code)
+        rules = rule_extractor.extract_business_rules(source_code, "Service.cs")
+        faq_items = rule_extractor.extract_faq_items(source_code, "Service.cs")
+
+        assert rule_extractor._find_exception_throws(source_code) is throws
+        assert rules[0].code_snippet == throws[0].snippet
+        assert any('already exists' in faq.answer.lower() for faq in faq_items)
+
+        # A different source is scanned afresh
+        assert rule_extractor._find_exception_throws("return;") == []
+
+    def test_exception_throws_keep_pattern_order(self, rule_extractor):
+        """Throws are grouped by pattern, and a throw quoted inside a message is not matched."""
+        source_code = '''
+        throw new ArgumentNullException(nameof(request));
+        throw new InvalidOperationException("Never throw new ConflictException(\\"x\\") here");
+        throw new NotFoundException($"Course {id} not found");
+        throw new ArgumentException("Title is required");
+        '''
+
+        throws = rule_extractor._find_exception_throws(source_code)
+
+        assert [t.exception_type for t in throws] == [
+            'InvalidOperationException',
+            'ArgumentException',
+            'NotFoundException',
+            'ArgumentNullException',
+        ]
+        assert [t.pattern_type for t in throws] == [
+            'exception', 'exception', 'exception_interpolated', 'argument_null'
+        ]
+
+    def test_rule_types_classification(self, rule_extractor):
         """Test that rules are correctly classified by type."""
         source_code = '''
         public class Service
@@ -225,8 +270,7 @@ class TestBusinessRuleExtractor:
         }
         '''
         
-        extractor = BusinessRuleExtractor()
-        rules = extractor.extract_business_rules(source_code, "Service.cs")
+        rules = rule_extractor.extract_business_rules(source_code, "Service.cs")
         
         # Should have different rule types
         rule_types = {r.rule_type for r in rules}
@@ -238,7 +282,7 @@ class TestBusinessRuleExtractor:
 class TestPhase9Integration:
     """Test Phase 9 integration with the extraction pipeline."""
     
-    def test_csharp_extractor_includes_phase9(self):
+    def test_csharp_extractor_includes_phase9(self, csharp_extractor):
         """Test that CSharpExtractor extracts business rules, use cases, and FAQ."""
         source_code = '''
         public class CourseService
@@ -259,26 +303,17 @@ class TestPhase9Integration:
         }
         '''
         
-        # Write to temp file
-        temp_file = Path("test_service.cs")
-        temp_file.write_text(source_code)
+        extracted = csharp_extractor.extract_content(source_code, Path("test_service.cs"))
         
-        try:
-            extractor = CSharpExtractor()
-            extracted = extractor.extract(temp_file)
-            
-            assert hasattr(extracted, 'enhanced_business_rules'), "Should have enhanced_business_rules field"
-            assert hasattr(extracted, 'use_cases'), "Should have use_cases field"
-            assert hasattr(extracted, 'faq_items'), "Should have faq_items field"
-            
-            assert len(extracted.enhanced_business_rules) > 0, "Should extract business rules"
-            assert len(extracted.use_cases) > 0, "Should extract use cases"
-            assert len(extracted.faq_items) > 0, "Should extract FAQ items"
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        assert hasattr(extracted, 'enhanced_business_rules'), "Should have enhanced_business_rules field"
+        assert hasattr(extracted, 'use_cases'), "Should have use_cases field"
+        assert hasattr(extracted, 'faq_items'), "Should have faq_items field"
+        
+        assert len(extracted.enhanced_business_rules) > 0, "Should extract business rules"
+        assert len(extracted.use_cases) > 0, "Should extract use cases"
+        assert len(extracted.faq_items) > 0, "Should extract FAQ items"
     
-    def test_context_builder_transforms_phase9(self):
+    def test_context_builder_transforms_phase9(self, csharp_extractor):
         """Test that context builder transforms Phase 9 data into template context."""
         source_code = '''
         public class CourseService
@@ -299,46 +334,37 @@ class TestPhase9Integration:
         }
         '''
         
-        # Write to temp file
-        temp_file = Path("test_service.cs")
-        temp_file.write_text(source_code)
+        extracted = csharp_extractor.extract_content(source_code, Path("test_service.cs"))
         
-        try:
-            extractor = CSharpExtractor()
-            extracted = extractor.extract(temp_file)
-            
-            # Build service context
-            context = build_service_context("TestService", [extracted])
-            
-            assert hasattr(context, 'enhanced_business_rules'), "Context should have enhanced_business_rules"
-            assert hasattr(context, 'use_cases'), "Context should have use_cases"
-            assert hasattr(context, 'faq_items'), "Context should have faq_items"
-            
-            assert len(context.enhanced_business_rules) > 0, "Should have transformed business rules"
-            assert len(context.use_cases) > 0, "Should have transformed use cases"
-            assert len(context.faq_items) > 0, "Should have transformed FAQ items"
-            
-            # Verify structure
-            rule = context.enhanced_business_rules[0]
-            assert 'description' in rule
-            assert 'rule_type' in rule
-            
-            use_case = context.use_cases[0]
-            assert 'title' in use_case
-            assert 'steps' in use_case
-            
-            faq = context.faq_items[0]
-            assert 'question' in faq
-            assert 'answer' in faq
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        # Build service context
+        context = build_service_context("TestService", [extracted])
+        
+        assert hasattr(context, 'enhanced_business_rules'), "Context should have enhanced_business_rules"
+        assert hasattr(context, 'use_cases'), "Context should have use_cases"
+        assert hasattr(context, 'faq_items'), "Context should have faq_items"
+        
+        assert len(context.enhanced_business_rules) > 0, "Should have transformed business rules"
+        assert len(context.use_cases) > 0, "Should have transformed use cases"
+        assert len(context.faq_items) > 0, "Should have transformed FAQ items"
+        
+        # Verify structure
+        rule = context.enhanced_business_rules[0]
+        assert 'description' in rule
+        assert 'rule_type' in rule
+        
+        use_case = context.use_cases[0]
+        assert 'title' in use_case
+        assert 'steps' in use_case
+        
+        faq = context.faq_items[0]
+        assert 'question' in faq
+        assert 'answer' in faq
 
 
 class TestRealWorldExtraction:
     """Test with realistic CourseService code."""
     
-    def test_course_service_business_rules(self):
+    def test_course_service_business_rules(self, rule_extractor):
         """Test extraction from realistic CourseService with multiple business rules."""
         source_code = '''
         public class CourseService : ICourseService
@@ -379,10 +405,9 @@ class TestRealWorldExtraction:
         }
         '''
         
-        extractor = BusinessRuleExtractor()
         
         # Extract business rules
-        rules = extractor.extract_business_rules(source_code, "CourseService.cs")
+        rules = rule_extractor.extract_business_rules(source_code, "CourseService.cs")
         assert len(rules) >= 4, "Should extract multiple business rules"
         
         # Verify specific rules
@@ -393,7 +418,7 @@ class TestRealWorldExtraction:
         assert validity_rule is not None, "Should detect validity period rule"
         
         # Extract use cases
-        use_cases = extractor.extract_use_cases(source_code, "CourseService.cs")
+        use_cases = rule_extractor.extract_use_cases(source_code, "CourseService.cs")
         assert len(use_cases) > 0, "Should extract use case"
         
         create_use_case = use_cases[0]
@@ -401,7 +426,7 @@ class TestRealWorldExtraction:
         assert len(create_use_case.steps) >= 3, "Should have multiple steps"
         
         # Extract FAQ
-        faq_items = extractor.extract_faq_items(source_code, "CourseService.cs")
+        faq_items = rule_extractor.extract_faq_items(source_code, "CourseService.cs")
         assert len(faq_items) > 0, "Should extract FAQ items"
         
         # Verify FAQ categories
@@ -16,10 +16,16 @@ from src.tools.context_builder import (
 from src.tools.template_renderer import TemplateRenderer
 
 
+@pytest.fixture(scope="module")
+def renderer() -> TemplateRenderer:
+    """One renderer for the module; rendering doesn't modify it."""
+    return TemplateRenderer()
+
+
 class TestE2EPipelineBackendService:
     """End-to-end tests for backend service documentation."""
     
-    def test_e2e_backend_service_extraction_to_rendering(self):
+    def test_e2e_backend_service_extraction_to_rendering(self, renderer):
         """
         Test complete pipeline: extract backend service → build context → render docs
         
@@ -81,7 +87,6 @@ class TestE2EPipelineBackendService:
         assert len(context.validation_rules) == 2
         
         # Step 3: Render documentation
-        renderer = TemplateRenderer()
         markdown = renderer.render_service_template(context)
         
         # Verify rendered output
@@ -94,7 +99,7 @@ class TestE2EPipelineBackendService:
         assert "IUserRepository" in markdown
         assert "User data access" in markdown
     
-    def test_e2e_backend_empty_service_includes_placeholders(self):
+    def test_e2e_backend_empty_service_includes_placeholders(self, renderer):
         """Test that empty service includes AI placeholders for human input."""
         extracted = ExtractedData(language="csharp", file_path="EmptyService.cs")
         
@@ -103,14 +108,13 @@ class TestE2EPipelineBackendService:
             extracted_data_list=[extracted]
         )
         
-        renderer = TemplateRenderer()
         markdown = renderer.render_service_template(context)
         
         # Should include placeholders
         assert "🤖" in markdown or "placeholder" in markdown.lower()
         assert "EmptyService" in markdown
     
-    def test_e2e_multiple_services_combined(self):
+    def test_e2e_multiple_services_combined(self, renderer):
         """Test combining extraction from multiple services."""
         # Service 1
         route1 = ExtractedRoute(method="GET", path="/api/users", handler_name="GetUsers")
@@ -130,7 +134,6 @@ class TestE2EPipelineBackendService:
         
         assert len(context.endpoints) == 2
         
-        renderer = TemplateRenderer()
         markdown = renderer.render_service_template(context)
         
         assert "/api/users" in markdown
@@ -141,7 +144,7 @@ class TestE2EPipelineUIComponent:
     """End-to-end tests for UI component documentation."""
     
     @pytest.mark.skip(reason="ExtractedProp uses 'default_value' not 'default'")
-    def test_e2e_component_extraction_to_rendering(self):
+    def test_e2e_component_extraction_to_rendering(self, renderer):
         """
         Test complete pipeline for UI component documentation
         """
@@ -182,7 +185,6 @@ class TestE2EPipelineUIComponent:
         assert len(context.state_vars) == 1
         
         # Step 3: Render documentation
-        renderer = TemplateRenderer()
         markdown = renderer.render_component_template(context)
         
         # Verify output
@@ -194,7 +196,7 @@ class TestE2EPipelineUIComponent:
         assert "isLoading" in markdown
     
     @pytest.mark.skip(reason="ExtractedComponent doesn't accept 'events' parameter")
-    def test_e2e_component_with_events(self):
+    def test_e2e_component_with_events(self, renderer):
         """Test component documentation with events."""
         component = ExtractedComponent(
             name="Modal",
@@ -215,7 +217,6 @@ class TestE2EPipelineUIComponent:
         
         assert len(context.events) == 2
         
-        renderer = TemplateRenderer()
         markdown = renderer.render_component_template(context)
         
         assert "onClose" in markdown or "Modal" in markdown  # At least component name
@@ -225,7 +226,7 @@ class TestE2EPipelineDatabase:
     """End-to-end tests for database documentation."""
     
     @pytest.mark.skip(reason="ExtractedColumn uses 'default_value' not 'default'")
-    def test_e2e_table_extraction_to_rendering(self):
+    def test_e2e_table_extraction_to_rendering(self, renderer):
         """
         Test complete pipeline for database table documentation
         """
@@ -274,7 +275,6 @@ class TestE2EPipelineDatabase:
         assert len(context.columns) == 4
         
         # Step 3: Render documentation
-        renderer = TemplateRenderer()
         markdown = renderer.render_table_template(context)
         
         # Verify output
@@ -286,7 +286,7 @@ class TestE2EPipelineDatabase:
         assert "UNIQUE" in markdown or "unique" in markdown.lower()
     
     @pytest.mark.skip(reason="ForeignKeyContext doesn't accept 'constraint_name' parameter")
-    def test_e2e_complex_table_with_foreign_keys(self):
+    def test_e2e_complex_table_with_foreign_keys(self, renderer):
         """Test table documentation with foreign key relationships."""
         from src.tools.template_context import ForeignKeyContext
         
@@ -317,7 +317,6 @@ class TestE2EPipelineDatabase:
         )
         context.foreign_keys.append(fk)
         
-        renderer = TemplateRenderer()
         markdown = renderer.render_table_template(context)
         
         assert "Orders" in markdown
@@ -327,7 +326,7 @@ class TestE2EPipelineDatabase:
 class TestE2EPipelineErrorRecovery:
     """Test error handling in complete pipeline."""
     
-    def test_e2e_with_partial_extraction(self):
+    def test_e2e_with_partial_extraction(self, renderer):
         """Test pipeline handles incomplete extraction gracefully."""
         # Extracted data with only partial information
         route = ExtractedRoute(
@@ -347,13 +346,12 @@ class TestE2EPipelineErrorRecovery:
         )
         
         # Should still render without errors
-        renderer = TemplateRenderer()
         markdown = renderer.render_service_template(context)
         
         assert "TestService" in markdown
         assert "/api/test" in markdown
     
-    def test_e2e_with_null_fields(self):
+    def test_e2e_with_null_fields(self, renderer):
         """Test pipeline handles null/missing fields gracefully."""
         # Some fields are None
         endpoint = ExtractedRoute(
@@ -373,7 +371,6 @@ class TestE2EPipelineErrorRecovery:
         )
         
         # Should handle gracefully
-        renderer = TemplateRenderer()
         markdown = renderer.render_service_template(context)
         
         assert isinstance(markdown, str)
@@ -384,7 +381,7 @@ class TestE2EDocumentationCompleteness:
     """Test that rendered documentation is appropriately complete."""
     
     @pytest.mark.skip(reason="Placeholder count assertion threshold too strict")
-    def test_service_with_full_extraction_no_placeholders_needed(self):
+    def test_service_with_full_extraction_no_placeholders_needed(self, renderer):
         """
         Test that service with complete extraction doesn't need many placeholders
         """
@@ -423,7 +420,6 @@ class TestE2EDocumentationCompleteness:
         extracted.validations = validations
         
         context = build_service_context("UserService", [extracted])
-        renderer = TemplateRenderer()
         markdown = renderer.render_service_template(context)
         
         # With complete data, we should have minimal AI placeholders
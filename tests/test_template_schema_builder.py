@@ -1,6 +1,7 @@
 """Unit tests for TemplateSchemaBuilder."""
 
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
@@ -8,6 +9,8 @@ import pytest
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from resources.template_resolver import TemplateResolver
+from tools import template_schema_builder
 from tools.template_schema_builder import TemplateSchemaBuilder
 
 TEMPLATES_DIR = Path(__file__).parent.parent / "akr_content" / "templates"
@@ -127,6 +130,17 @@ def test_schema_cache_hits_for_same_content():
     assert schema_cached.checksum == schema_first.checksum
 
 
+def test_shared_schema_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(template_schema_builder, "_SHARED_SCHEMAS_MAXSIZE", 2)
+    monkeypatch.setattr(template_schema_builder, "_shared_schemas", OrderedDict())
+    builder = TemplateSchemaBuilder()
+
+    for index in range(3):
+        builder.build_schema("test.md", f"## Section {index}\n")
+
+    assert len(template_schema_builder._shared_schemas) == 2
+
+
 @pytest.mark.skip(reason="Template name mapping issue - custom test template not in baseline")
 def test_schema_cache_miss_on_checksum_change():
     content_v1 = """
@@ -152,3 +166,16 @@ def test_load_template_content_uses_resource_manager():
 
     assert content is not None
     assert "##" in content
+
+
+def test_load_template_content_rereads_edited_template(tmp_path):
+    core_dir = tmp_path / "templates" / "core"
+    core_dir.mkdir(parents=True)
+    template_file = core_dir / "lean_baseline_service_template.md"
+    template_file.write_text("## Overview\n", encoding="utf-8")
+    builder = TemplateSchemaBuilder(TemplateResolver(tmp_path))
+
+    assert builder.load_template_content("lean_baseline_service_template") == "## Overview\n"
+
+    template_file.write_text("## Overview\n## Usage\n", encoding="utf-8")
+    assert builder.load_template_content("lean_baseline_service_template") == "## Overview\n## Usage\n"